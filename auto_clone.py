@@ -91,9 +91,16 @@ class AutoCloner:
             return False
         
         self.headers = self.identifier.headers
+        self.close()  # Re-authenticating replaces the cloner - release the old one's connections
         self.cloner = DashboardCloner(self.metabase_config)
         return self.cloner.authenticate()
     
+    def close(self):
+        """Close the cloner's HTTP connections"""
+        if self.cloner is not None:
+            self.cloner.close()
+            self.cloner = None
+    
     def get_source_dashboards(self) -> Dict[str, int]:
         """Get source dashboard IDs from config"""
         return self.auto_config.get('source_dashboards', {})
@@ -274,6 +281,9 @@ class AutoCloner:
             logger.info(f"_DASHBOARDS Collection: {task.dashboards_collection_id}")
             logger.info(f"{'='*60}")
             
+            # Scheduled runs reuse the cloner - don't trust a collection list from an earlier run
+            self.cloner.invalidate_collections_cache()
+            
             # Create customer collection for linked dashboards and questions
             # This will be in the same parent as the source dashboard
             source_parent = self.cloner.get_dashboard_collection_id(task.source_dashboard_id)
@@ -301,7 +311,8 @@ class AutoCloner:
                     new_database_id=task.database.id,
                     dashboard_collection_id=customer_collection_id,  # For linked dashboards
                     questions_collection_id=customer_collection_id,  # For questions
-                    main_dashboard_collection_id=task.dashboards_collection_id  # Main dashboard goes here
+                    main_dashboard_collection_id=task.dashboards_collection_id,  # Main dashboard goes here
+                    precomputed_linked=all_linked
                 )
             else:
                 # Clone single dashboard -> _DASHBOARDS collection
@@ -436,31 +447,31 @@ def main():
     args = parser.parse_args()
     
     auto_cloner = AutoCloner()
-    
-    print("Connecting to Metabase...")
-    if not auto_cloner.authenticate():
-        print("ERROR: Failed to authenticate!")
-        return
-    print("Connected!\n")
-    
-    # Check config
-    source_dashboards = auto_cloner.get_source_dashboards()
-    dashboards_collections = auto_cloner.get_dashboards_collections()
-    
-    missing_config = []
-    for db_type in ["content", "message", "email"]:
-        if not source_dashboards.get(db_type):
-            missing_config.append(f"{db_type} source_dashboard")
-        if not dashboards_collections.get(db_type):
-            missing_config.append(f"{db_type} dashboards_collection")
-    
-    if missing_config:
-        print("[WARNING] Missing configuration:")
-        for m in missing_config:
-            print(f"  - {m}")
-        print("\nPlease edit auto_clone_config.json with the required IDs.")
-        print("\nExample:")
-        print('''{
+    try:
+        print("Connecting to Metabase...")
+        if not auto_cloner.authenticate():
+            print("ERROR: Failed to authenticate!")
+            return
+        print("Connected!\n")
+        
+        # Check config
+        source_dashboards = auto_cloner.get_source_dashboards()
+        dashboards_collections = auto_cloner.get_dashboards_collections()
+        
+        missing_config = []
+        for db_type in ["content", "message", "email"]:
+            if not source_dashboards.get(db_type):
+                missing_config.append(f"{db_type} source_dashboard")
+            if not dashboards_collections.get(db_type):
+                missing_config.append(f"{db_type} dashboards_collection")
+        
+        if missing_config:
+            print("[WARNING] Missing configuration:")
+            for m in missing_config:
+                print(f"  - {m}")
+            print("\nPlease edit auto_clone_config.json with the required IDs.")
+            print("\nExample:")
+            print('''{
     "source_dashboards": {
         "content": 3,
         "message": 5,
@@ -472,20 +483,22 @@ def main():
         "email": 12
     }
 }''')
+            
+            # Still show status even without full config
+            if not args.run:
+                print("\nShowing database identification anyway...\n")
+                grouped = auto_cloner.identifier.get_databases_by_type()
+                auto_cloner.identifier.print_summary(grouped)
+            return
         
-        # Still show status even without full config
-        if not args.run:
-            print("\nShowing database identification anyway...\n")
-            grouped = auto_cloner.identifier.get_databases_by_type()
-            auto_cloner.identifier.print_summary(grouped)
-        return
-    
-    # Run
-    auto_cloner.run(
-        db_type_filter=args.type,
-        customer_filter=args.customer,
-        dry_run=not args.run
-    )
+        # Run
+        auto_cloner.run(
+            db_type_filter=args.type,
+            customer_filter=args.customer,
+            dry_run=not args.run
+        )
+    finally:
+        auto_cloner.close()
 
 
 if __name__ == "__main__":
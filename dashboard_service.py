@@ -710,6 +710,7 @@ class DashboardService:
         self.stop_requested = False  # Reset stop flag
         self.current_status = "Running check..."
         self.last_run = datetime.now()
+        cloner = None
         
         try:
             logging.info("="*60)
@@ -878,12 +879,15 @@ class DashboardService:
                     try:
                         # Reset cloner mappings for fresh attempt
                         if attempt > 1:
+                            cloner.discard_checkpoint()
                             cloner.question_mapping = {}
                             cloner.dashboard_mapping = {}
                             logging.info(f"  Retry attempt {attempt}/{MAX_RETRIES}...")
                             time.sleep(attempt * 3)  # Wait 3s, 6s, 9s between retries
                         
-                        # Create customer collection
+                        # Create customer collection (re-reading collections - other
+                        # processes may have created some since the last task)
+                        cloner.invalidate_collections_cache()
                         source_parent = cloner.get_dashboard_collection_id(task["source_dashboard_id"])
                         collection_name = f"{task['customer_name']} Collection"
                         col = cloner.get_or_create_collection(collection_name, source_parent)
@@ -899,7 +903,8 @@ class DashboardService:
                                 new_database_id=db.id,
                                 dashboard_collection_id=customer_collection_id,
                                 questions_collection_id=customer_collection_id,
-                                main_dashboard_collection_id=task["dashboards_collection_id"]
+                                main_dashboard_collection_id=task["dashboards_collection_id"],
+                                precomputed_linked=all_linked
                             )
                         else:
                             new_dashboard = cloner.clone_dashboard(
@@ -989,6 +994,8 @@ class DashboardService:
             traceback.print_exc()
         
         finally:
+            if cloner is not None:
+                cloner.close()
             self.is_running = False
             self.is_manual_run = False  # Reset manual run flag
     
@@ -1628,6 +1635,7 @@ def _execute_dashboard_update(task_id, dashboard_id, dashboard_type, dashboard_n
     task = update_tasks[task_id]
     headers = None
     base_url = None
+    cloner = None
     
     def check_cancelled():
         """Check if cancel was requested and handle cleanup"""
@@ -1806,7 +1814,8 @@ def _execute_dashboard_update(task_id, dashboard_id, dashboard_type, dashboard_n
                     new_database_id=target_database_id,
                     dashboard_collection_id=new_questions_collection_id,
                     questions_collection_id=new_questions_collection_id,
-                    main_dashboard_collection_id=dashboards_collection_id
+                    main_dashboard_collection_id=dashboards_collection_id,
+                    precomputed_linked=all_linked
                 )
             else:
                 new_dashboard = cloner.clone_dashboard(
@@ -1820,6 +1829,7 @@ def _execute_dashboard_update(task_id, dashboard_id, dashboard_type, dashboard_n
             # Clone was cancelled
             task['status'] = 'Cleaning up cancelled update...'
             _cleanup_created_items(task, headers, base_url)
+            cloner.discard_checkpoint()
             # Also delete the temp collection
             if new_questions_collection_id:
                 try:
@@ -1989,6 +1999,8 @@ def _execute_dashboard_update(task_id, dashboard_id, dashboard_type, dashboard_n
         if headers and base_url:
             task['status'] = 'Cleaning up after error...'
             _cleanup_created_items(task, headers, base_url)
+            if cloner is not None:
+                cloner.discard_checkpoint()
             # Also delete the temp collection if created
             temp_col_id = task.get('created_items', {}).get('collection_id')
             if temp_col_id:
@@ -2006,6 +2018,10 @@ def _execute_dashboard_update(task_id, dashboard_id, dashboard_type, dashboard_n
         old_dash_id = task.get('old_dashboard_id')
         if old_dash_id and dashboard_to_task.get(old_dash_id) == task_id:
             del dashboard_to_task[old_dash_id]
+    
+    finally:
+        if cloner is not None:
+            cloner.close()
 
 
 @app.route('/api/dashboard/update/status/<task_id>')
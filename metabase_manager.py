@@ -4,6 +4,8 @@ Automates the process of creating, updating, and migrating dashboards across dif
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
 from typing import Dict, List, Optional, Any
@@ -14,6 +16,14 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 
+def collection_parent_id(collection: Dict) -> Optional[int]:
+    """Parent collection id - from parent_id, else the last segment of location ('/1/5/' -> 5)"""
+    if collection.get('parent_id') is not None:
+        return collection['parent_id']
+    segments = [seg for seg in (collection.get('location') or '').split('/') if seg]
+    return int(segments[-1]) if segments and segments[-1].isdigit() else None
+
+
 @dataclass
 class MetabaseConfig:
     """Configuration for Metabase connection"""
@@ -32,10 +42,24 @@ class MetabaseManager:
         self.session_token = None
         self.headers = {}
         
+        # Shared HTTP session - keep-alive + connection pooling across all API calls
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+    
+    def close(self):
+        """Close the underlying HTTP session"""
+        self.session.close()
+        
     def authenticate(self) -> bool:
         """Authenticate with Metabase and get session token"""
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/session",
                 json={
                     "username": self.config.username,
@@ -54,7 +78,7 @@ class MetabaseManager:
     def get_databases(self) -> List[Dict]:
         """Get all databases"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/database",
                 headers=self.headers
             )
@@ -69,7 +93,7 @@ class MetabaseManager:
     def get_collections(self) -> List[Dict]:
         """Get all collections"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/collection",
                 headers=self.headers
             )
@@ -84,7 +108,7 @@ class MetabaseManager:
     def get_questions(self, database_id: Optional[int] = None) -> List[Dict]:
         """Get all questions/cards, optionally filtered by database"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/card",
                 headers=self.headers
             )
@@ -103,7 +127,7 @@ class MetabaseManager:
     def get_dashboard(self, dashboard_id: int) -> Optional[Dict]:
         """Get dashboard details including all cards"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/dashboard/{dashboard_id}",
                 headers=self.headers
             )
@@ -118,7 +142,7 @@ class MetabaseManager:
     def get_all_dashboards(self) -> List[Dict]:
         """Get all dashboards"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/dashboard",
                 headers=self.headers
             )
@@ -140,7 +164,7 @@ class MetabaseManager:
             if collection_id:
                 payload["collection_id"] = collection_id
                 
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/dashboard",
                 headers=self.headers,
                 json=payload
@@ -156,7 +180,7 @@ class MetabaseManager:
     def update_dashboard(self, dashboard_id: int, updates: Dict) -> bool:
         """Update dashboard properties"""
         try:
-            response = requests.put(
+            response = self.session.put(
                 f"{self.base_url}/api/dashboard/{dashboard_id}",
                 headers=self.headers,
                 json=updates
@@ -189,7 +213,7 @@ class MetabaseManager:
                 payload["visualization_settings"] = visualization_settings
             if series:
                 payload["series"] = series
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/dashboard/{dashboard_id}/cards",
                 headers=self.headers,
                 json=payload
@@ -226,7 +250,7 @@ class MetabaseManager:
         """Clone a question and optionally change its database"""
         try:
             # Get original question
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/card/{question_id}",
                 headers=self.headers
             )
@@ -248,7 +272,7 @@ class MetabaseManager:
             if collection_id:
                 new_question["collection_id"] = collection_id
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/card",
                 headers=self.headers,
                 json=new_question
@@ -390,7 +414,7 @@ class MetabaseManager:
                 
                 try:
                     # Get question
-                    response = requests.get(
+                    response = self.session.get(
                         f"{self.base_url}/api/card/{question_id}",
                         headers=self.headers
                     )
@@ -403,7 +427,7 @@ class MetabaseManager:
                         question["dataset_query"]["database"] = new_database_id
                         
                         # Update question
-                        response = requests.put(
+                        response = self.session.put(
                             f"{self.base_url}/api/card/{question_id}",
                             headers=self.headers,
                             json=question
@@ -3,13 +3,49 @@ Dashboard Clone with Database Change
 Clones dashboard with all questions, filters, click behaviors, and dashboard links
 """
 
+import os
 import sys
+import copy
+import contextvars
 import json
+import time
+import random
+import uuid
+import gzip
+import hashlib
 import logging
+import threading
+import queue
+import traceback
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, Future
 from difflib import get_close_matches
-from typing import Dict, List, Optional, Any
-from metabase_manager import MetabaseManager, MetabaseConfig
+from typing import Dict, Iterator, List, Optional, Any
+from metabase_manager import MetabaseManager, MetabaseConfig, collection_parent_id
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from rapidfuzz import process as fuzz_process, fuzz
+except ImportError:
+    fuzz_process = None
+
+# HTTP/2 client - only used when the h2 extra is installed too (httpx[http2])
+try:
+    import httpx
+    import h2  # noqa: F401
+except ImportError:
+    httpx = None
 
 # Fix Windows console encoding
 if sys.platform == 'win32':
@@ -21,6 +57,56 @@ if sys.platform == 'win32':
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+_uuid4 = uuid.uuid4
+
+# Per-dashboard log prefix (e.g. "[2/5]") so interleaved parallel clones stay readable
+_log_label = contextvars.ContextVar('clone_log_label', default='')
+
+
+class _LogLabelFilter(logging.Filter):
+    """Prefix records with the current clone's label, after any leading newlines"""
+    def filter(self, record):
+        label = _log_label.get()
+        if label:
+            msg = str(record.msg)
+            body = msg.lstrip('\n')
+            record.msg = f"{msg[:len(msg) - len(body)]}{label} {body}"
+        return True
+
+
+logger.addFilter(_LogLabelFilter())
+
+
+def _submit(executor, fn, *args):
+    """Submit fn to an executor, carrying the caller's context (log label) into the worker"""
+    return executor.submit(contextvars.copy_context().run, fn, *args)
+
+# Max concurrent question clones (I/O bound - kept small to avoid overloading Metabase)
+CLONE_WORKERS = 8
+
+# Max linked dashboards cloned at once (each one also runs up to CLONE_WORKERS question clones)
+DASHBOARD_WORKERS = 4
+
+# On-disk cache for read-only source payloads (database metadata)
+DISK_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.metabase_clone_cache')
+DISK_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+# Dashboards/cards fetched during one clone operation are reused for this long
+LOAD_CACHE_TTL_SECONDS = 10
+
+# Request bodies at least this large are gzipped when 'gzip_requests' is enabled
+GZIP_MIN_BYTES = 16 * 1024
+
+# Dashboard responses larger than this (or of unknown size) are stream-parsed with ijson
+STREAM_PARSE_MIN_BYTES = 512 * 1024
+
+# The parts of a dashboard the dashcard/tab update paths actually read
+DASHBOARD_LAYOUT_KEYS = ('dashcards', 'ordered_cards', 'tabs')
+
+# Resume checkpoint for clone_with_all_linked - only written when the caller passes a
+# checkpoint_dir (the CLI does), removed once the clone completes
+CHECKPOINT_TEMPLATE = '.clone_ckpt_{source_id}.json'
+
 
 def load_config():
     """Load configuration from MongoDB"""
@@ -38,6 +124,108 @@ def load_config():
         return None
 
 
+def _dumps(obj) -> bytes:
+    """Serialize to JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _int_keys(mapping) -> Dict[int, int]:
+    """Undo JSON's stringified keys on an id -> id mapping"""
+    return {int(k): int(v) for k, v in (mapping or {}).items()}
+
+
+def _canonical_key(obj) -> bytes:
+    """Order-independent JSON key for hash-consing equal settings dicts"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(data):
+    """Parse JSON bytes/str (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _retry_delay(attempt: int, response=None) -> float:
+    """Jittered exponential backoff (capped at 30s), honoring Retry-After when sent"""
+    delay = min(30, 2 ** (attempt - 1)) + random.uniform(0, 1)
+    if response is not None:
+        retry_after = response.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            delay = max(delay, int(retry_after))
+    return delay
+
+
+def _schema_table_entry(table: dict) -> dict:
+    """Reduce a metadata table to the (id, name) data used for mapping"""
+    return {
+        'id': table['id'],
+        'name': table['name'],
+        'fields': [{'id': f['id'], 'name': f['name']} for f in table.get('fields') or []]
+    }
+
+
+def _stream_top_level(fp, keys) -> dict:
+    """Build only the given top-level keys of a streamed JSON object with ijson"""
+    result = {}
+    builder = None
+    current = None
+    for prefix, event, value in ijson.parse(fp, use_float=True):
+        if prefix == '' and event in ('map_key', 'end_map'):
+            if builder is not None:
+                result[current] = builder.value
+                builder = None
+            if event == 'map_key' and value in keys:
+                current = value
+                builder = ijson.ObjectBuilder()
+            continue
+        if builder is not None:
+            builder.event(event, value)
+    return result
+
+
+def _iter_click_behaviors(dashcard: dict):
+    """Yield every click behavior dict on a dashcard and its card (top-level, 'click' and per-column)"""
+    card = dashcard.get('card') or {}
+    for settings in (dashcard.get('visualization_settings') or {}, card.get('visualization_settings') or {}):
+        for key in ('click_behavior', 'click'):
+            cb = settings.get(key)
+            if isinstance(cb, dict):
+                yield cb
+        for col_settings in (settings.get('column_settings') or {}).values():
+            cb = col_settings.get('click_behavior') if isinstance(col_settings, dict) else None
+            if isinstance(cb, dict):
+                yield cb
+
+
+def _new_dashcard_payload(index: int, dc: dict) -> dict:
+    """Build the PUT /api/dashboard entry for a new dashcard (negative id = create)"""
+    get = dc.get
+    payload = {
+        "id": -(index + 1),
+        "card_id": dc['card_id'],
+        "row": get('row', 0),
+        "col": get('col', 0),
+        "size_x": get('size_x', 4),
+        "size_y": get('size_y', 4),
+        "parameter_mappings": get('parameter_mappings') or [],
+        # Only click_behavior is kept in visualization_settings upstream
+        # to preserve links without causing filter conflicts
+        "visualization_settings": get('visualization_settings') or {},
+    }
+    tab_id = get('dashboard_tab_id')
+    if tab_id:
+        payload['dashboard_tab_id'] = tab_id
+    series = get('series')
+    if series:
+        payload['series'] = series
+    return payload
+
+
 class StopRequested(Exception):
     """Exception raised when stop is requested during cloning"""
     pass
@@ -62,13 +250,317 @@ class DashboardCloner:
             password=config['password']
         ))
         self.headers = {}
-        self.table_mapping = {}  # old_table_id -> new_table_id
-        self.field_mapping = {}  # old_field_id -> new_field_id
-        self.question_mapping = {}  # old_question_id -> new_question_id
-        self.dashboard_mapping = {}  # old_dashboard_id -> new_dashboard_id
-        self.tab_mapping = {}  # old_tab_id -> new_tab_id (legacy, for single dashboard)
-        self.dashboard_tab_mappings = {}  # new_dashboard_id -> {old_tab_id -> new_tab_id}
+        self._db_by_lname = None  # lowercase name -> database (see _ensure_db_index)
+        self._col_by_lname = None  # lowercase name -> collection (see _ensure_collection_index)
+        self._col_by_name_parent = None  # (name, parent_id) -> collection (see _collections_by_name_parent)
+        self._collections = None  # Raw collection list backing both indexes
+        self.table_mapping: Dict[int, int] = {}  # old_table_id -> new_table_id
+        self.field_mapping: Dict[int, int] = {}  # old_field_id -> new_field_id
+        self.question_mapping: Dict[int, int] = {}  # old_question_id -> new_question_id
+        self.dashboard_mapping: Dict[int, int] = {}  # old_dashboard_id -> new_dashboard_id
+        self.tab_mapping: Dict[int, int] = {}  # old_tab_id -> new_tab_id of the main dashboard (legacy fallback)
+        self.dashboard_tab_mappings: Dict[int, Dict[int, int]] = {}  # new_dashboard_id -> {old_tab_id -> new_tab_id}
         self.stop_check_callback = stop_check_callback
+        self._lock = threading.Lock()  # Guards shared mappings during parallel cloning
+        self._local = threading.local()  # Per-thread state (dashboard_load_id of the clone in progress)
+        self._inflight_questions: Dict[int, Future] = {}  # question clones in progress, shared across threads
+        self._dashboards_with_click_behaviors = set()  # new dashboard ids with dashboard/question links
+        self._checkpoint_path = None  # resume checkpoint of the clone_with_all_linked run in progress
+        
+        # Concurrency limits - 'dashboard_workers' bounds dashboards cloned/updated at once,
+        # 'clone_workers' the card GETs/POSTs each of them issues at once (--workers sets both)
+        self.dashboard_workers = config.get('dashboard_workers', DASHBOARD_WORKERS)
+        self.clone_workers = config.get('clone_workers', CLONE_WORKERS)
+        
+        # Persistent cache for source database metadata - opt-in (disk_cache=True / --cache),
+        # long-lived service cloners must always see the current source
+        self.disk_cache_enabled = config.get('disk_cache', False)
+        self._cache_ttl_seconds = config.get('cache_ttl_seconds', DISK_CACHE_TTL_SECONDS)
+        self._cache_dir = config.get('cache_dir', DISK_CACHE_DIR)
+        
+        # Off by default - stock Metabase does not decode gzipped request bodies
+        # (enable only behind a proxy that does)
+        self.gzip_requests = config.get('gzip_requests', False)
+        
+        # Short-lived cache of dashboards/cards scoped to one clone operation
+        self._load_id = _uuid4().hex
+        self._load_cache = {}  # (kind, id) -> (fetched_at, payload)
+        self._links_cache: Dict[int, frozenset] = {}  # dashboard_id -> linked dashboard ids
+        self._viz_intern: Dict[bytes, dict] = {}  # canonical JSON -> shared viz settings dict
+        
+        # Conditional GETs: last ETag and body seen per dashboard (survives load scopes)
+        self._etags: Dict[int, str] = {}
+        self._dash_cache: Dict[int, dict] = {}
+        
+        # Shared HTTP session - keep-alive + connection pooling across all API calls
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Optional HTTP/2 client for the card GET/POST hot path - parallel clones are
+        # multiplexed over one connection. Opt-in (config 'http2') and only with httpx[http2]
+        # installed: it bypasses the requests session's retry adapter, CA bundle and proxy
+        # settings, so by default cards go through the requests session like everything else.
+        self.http = None
+        if httpx is not None and config.get('http2', False):
+            self.http = httpx.Client(
+                http2=True,
+                timeout=30,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                transport=httpx.HTTPTransport(http2=True, retries=3)
+            )
+    
+    def close(self):
+        """Close the underlying HTTP session(s)"""
+        self.session.close()
+        self.manager.close()
+        if self.http is not None:
+            self.http.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _disk_cache_path(self, key: str) -> str:
+        digest = hashlib.sha256(f"{self.base_url}|{key}".encode('utf-8')).hexdigest()
+        return os.path.join(self._cache_dir, f"{digest}.json")
+    
+    def _disk_cache_get(self, key: str):
+        """Return the cached payload for an API path, or None if missing/expired"""
+        if not self.disk_cache_enabled:
+            return None
+        path = self._disk_cache_path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self._cache_ttl_seconds:
+                return None
+            with open(path, 'rb') as f:
+                return _loads(f.read())
+        except (OSError, ValueError):
+            return None
+    
+    def _disk_cache_put(self, key: str, obj):
+        """Store a payload for an API path (best effort - failures are ignored)"""
+        if not self.disk_cache_enabled or not obj:
+            return
+        path = self._disk_cache_path(key)
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(obj))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("Could not write disk cache entry %s: %s", key, e)
+
+    def _save_checkpoint(self, path: str, meta: dict):
+        """Write the current id mappings to a resume checkpoint (best effort, atomic)"""
+        with self._lock:
+            state = dict(meta)
+            state.update({
+                'dashboard': dict(self.dashboard_mapping),
+                'question': dict(self.question_mapping),
+                'tab': dict(self.tab_mapping),
+                'dashboard_tab': {k: dict(v) for k, v in self.dashboard_tab_mappings.items()},
+                'with_click_behaviors': list(self._dashboards_with_click_behaviors),
+            })
+            try:
+                tmp_path = f"{path}.{threading.get_ident()}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(_dumps(state))
+                os.replace(tmp_path, path)
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning("Could not write clone checkpoint %s: %s", path, e)
+    
+    def _load_checkpoint(self, path: str, meta: dict) -> bool:
+        """Restore id mappings from a checkpoint written for the same clone; True if restored"""
+        try:
+            with open(path, 'rb') as f:
+                state = _loads(f.read())
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable clone checkpoint %s: %s", path, e)
+            return False
+    
+        if any(state.get(k) != v for k, v in meta.items()):
+            logger.info("Ignoring clone checkpoint %s - it was written for a different clone", path)
+            return False
+    
+        self.dashboard_mapping = _int_keys(state.get('dashboard'))
+        self.question_mapping = _int_keys(state.get('question'))
+        self.tab_mapping = _int_keys(state.get('tab'))
+        self.dashboard_tab_mappings = {
+            int(k): _int_keys(v) for k, v in (state.get('dashboard_tab') or {}).items()
+        }
+        self._dashboards_with_click_behaviors = set(state.get('with_click_behaviors') or [])
+        self._drop_missing_checkpoint_ids()
+        return True
+    
+    def _drop_missing_checkpoint_ids(self):
+        """Forget restored dashboards/questions that were deleted or archived since the checkpoint"""
+        def exists(kind, object_id):
+            try:
+                response = self.session.get(f"{self.base_url}/api/{kind}/{object_id}")
+                if response.status_code == 404:
+                    return False
+                response.raise_for_status()
+                return not _loads(response.content).get('archived', False)
+            except Exception as e:
+                logger.warning("Could not verify checkpointed %s %s: %s", kind, object_id, e)
+                return False
+        
+        checks = [('dashboard', old_id, new_id) for old_id, new_id in self.dashboard_mapping.items()]
+        checks += [('card', old_id, new_id) for old_id, new_id in self.question_mapping.items()]
+        if not checks:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(self.clone_workers, len(checks))) as executor:
+            results = list(executor.map(lambda c: exists(c[0], c[2]), checks))
+        
+        for (kind, old_id, new_id), ok in zip(checks, results):
+            if ok:
+                continue
+            logger.warning("Checkpointed %s %s -> %s no longer exists - it will be cloned again",
+                           kind, old_id, new_id)
+            if kind == 'dashboard':
+                del self.dashboard_mapping[old_id]
+                self.dashboard_tab_mappings.pop(new_id, None)
+                self._dashboards_with_click_behaviors.discard(new_id)
+            else:
+                del self.question_mapping[old_id]
+    
+    def discard_checkpoint(self):
+        """Delete the resume checkpoint of the last clone_with_all_linked run, if any
+        (call when cleaning up the items a failed or cancelled run created)"""
+        path = self._checkpoint_path
+        self._checkpoint_path = None
+        if path:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
+    def _start_load_scope(self):
+        """Begin a new clone operation: new load id, empty load cache and intern table"""
+        self._load_id = _uuid4().hex
+        self._load_cache = {}
+        self._viz_intern = {}
+    
+    def invalidate_links_cache(self):
+        """Forget memoized analyze_dashboard_links results (call when source dashboards may have changed)"""
+        self._links_cache = {}
+    
+    def _load_get(self, kind: str, object_id: int):
+        """Get a 'dashboard' or 'card' payload, reusing one fetched in the last few seconds"""
+        key = (kind, object_id)
+        entry = self._load_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < LOAD_CACHE_TTL_SECONDS:
+            return entry[1]
+        
+        if kind == 'card':
+            value = self.get_question(object_id)
+        else:
+            value = self._fetch_dashboard(object_id)
+        if value:
+            self._load_cache[key] = (time.monotonic(), value)
+        return value
+    
+    def _load_params(self) -> dict:
+        """Query params that let Metabase memoize metadata across one dashboard load burst"""
+        return {'dashboard_load_id': getattr(self._local, 'load_id', self._load_id)}
+    
+    def _fetch_dashboard(self, dashboard_id: int):
+        """GET a dashboard, tagged with the current dashboard_load_id.
+        Revalidates with If-None-Match and reuses the previous body on 304."""
+        try:
+            headers = {}
+            etag = self._etags.get(dashboard_id)
+            if etag and dashboard_id in self._dash_cache:
+                headers['If-None-Match'] = etag
+            
+            response = self.session.get(
+                f"{self.base_url}/api/dashboard/{dashboard_id}",
+                params=self._load_params(),
+                headers=headers
+            )
+            if response.status_code == 304:
+                logger.debug("Dashboard %s not modified - using cached copy", dashboard_id)
+                return self._dash_cache[dashboard_id]
+            response.raise_for_status()
+            dashboard = _loads(response.content)
+            
+            etag = response.headers.get('ETag')
+            if etag and 'no-store' not in response.headers.get('Cache-Control', ''):
+                self._etags[dashboard_id] = etag
+                self._dash_cache[dashboard_id] = dashboard
+            else:
+                self._etags.pop(dashboard_id, None)
+                self._dash_cache.pop(dashboard_id, None)
+            
+            logger.info("Retrieved dashboard: %s", dashboard.get('name'))
+            return dashboard
+        except Exception as e:
+            logger.error("Failed to get dashboard %s: %s", dashboard_id, e)
+            return None
+    
+    def _get_dashboard_layout(self, dashboard_id: int) -> dict:
+        """
+        Get just the dashcards/tabs of a dashboard. Reuses a cached full dashboard when
+        there is one; otherwise large responses are stream-parsed so the rest of the
+        payload (full card definitions, result metadata) is never materialized.
+        Raises on HTTP errors.
+        """
+        entry = self._load_cache.get(('dashboard', dashboard_id))
+        if entry is not None and time.monotonic() - entry[0] < LOAD_CACHE_TTL_SECONDS:
+            return {k: entry[1][k] for k in DASHBOARD_LAYOUT_KEYS if k in entry[1]}
+        
+        url = f"{self.base_url}/api/dashboard/{dashboard_id}"
+        with self.session.get(url, params=self._load_params(), stream=True) as response:
+            response.raise_for_status()
+            length = response.headers.get('Content-Length')
+            if ijson is None or (length is not None and int(length) < STREAM_PARSE_MIN_BYTES):
+                dashboard = _loads(response.content)
+                return {k: dashboard[k] for k in DASHBOARD_LAYOUT_KEYS if k in dashboard}
+            response.raw.decode_content = True
+            return _stream_top_level(response.raw, DASHBOARD_LAYOUT_KEYS)
+    
+    def _intern_viz(self, viz_settings: dict) -> dict:
+        """Return one shared dict per distinct visualization_settings value"""
+        if not viz_settings:
+            return viz_settings
+        return self._viz_intern.setdefault(_canonical_key(viz_settings), viz_settings)
+    
+    def _invalidate_load(self, kind: str, object_id: int):
+        """Drop a cached payload after writing to it"""
+        self._load_cache.pop((kind, object_id), None)
+    
+    def _get_dashboard(self, dashboard_id: int):
+        """Get a dashboard through the per-operation load cache"""
+        return self._load_get('dashboard', dashboard_id)
+    
+    def _post_json(self, url: str, payload):
+        """POST a JSON body serialized with orjson (falls back to stdlib json)"""
+        headers = {'Content-Type': 'application/json'}
+        if self.http is not None:
+            return self.http.post(url, content=_dumps(payload), headers=headers)
+        return self.session.post(url, data=_dumps(payload), headers=headers)
+    
+    def _put_json(self, url: str, payload):
+        """PUT a JSON body serialized with orjson (falls back to stdlib json).
+        Large bodies are gzipped when gzip_requests is enabled."""
+        body = _dumps(payload)
+        headers = {'Content-Type': 'application/json'}
+        if self.gzip_requests and len(body) >= GZIP_MIN_BYTES:
+            body = gzip.compress(body, compresslevel=1)
+            headers['Content-Encoding'] = 'gzip'
+        return self.session.put(url, data=body, headers=headers)
     
     def check_stop_requested(self):
         """Check if stop was requested and raise exception if so"""
@@ -80,6 +572,12 @@ class DashboardCloner:
         """Authenticate with Metabase"""
         if self.manager.authenticate():
             self.headers = self.manager.headers
+            self.session.headers.update(self.headers)
+            if self.http is not None:
+                self.http.headers.update(self.headers)
+            # Name indexes are built lazily per authenticated session
+            self._db_by_lname = None
+            self.invalidate_collections_cache()
             return True
         return False
     
@@ -88,30 +586,81 @@ class DashboardCloner:
         return self.manager.get_databases()
     
     def get_collections(self):
-        """Get all collections"""
-        return self.manager.get_collections()
+        """Get all collections (fetched once per clone run and shared by the collection indexes).
+        An empty result (the manager returns [] on errors) is not cached."""
+        if self._collections is None:
+            collections = self.manager.get_collections()
+            if not collections:
+                return collections
+            self._collections = collections
+        return self._collections
+    
+    def _ensure_db_index(self):
+        """Build the lowercase-name -> database index on first use"""
+        if self._db_by_lname is None:
+            index = {}
+            for db in self.get_databases():
+                index.setdefault(db['name'].lower(), db)
+            self._db_by_lname = index
+        return self._db_by_lname
+    
+    def _ensure_collection_index(self):
+        """Build the lowercase-name -> collection index on first use"""
+        if self._col_by_lname is None:
+            index = {}
+            for col in self.get_collections():
+                index.setdefault(col['name'].lower(), col)
+            if not index:
+                return index  # Failed fetch - retry next time
+            self._col_by_lname = index
+        return self._col_by_lname
+    
+    def _collections_by_name_parent(self) -> dict:
+        """Memoized {(name, parent_id): collection} index (parent_id None = root)"""
+        if self._col_by_name_parent is None:
+            index = {}
+            for col in self.get_collections():
+                index.setdefault((col.get('name'), collection_parent_id(col)), col)
+            if not index:
+                return index  # Failed fetch - retry next time
+            self._col_by_name_parent = index
+        return self._col_by_name_parent
+    
+    def invalidate_collections_cache(self):
+        """Drop the collection list and indexes (call after creating/moving collections)"""
+        self._collections = None
+        self._col_by_lname = None
+        self._col_by_name_parent = None
+    
+    def find_collection_in_parent(self, name: str, parent_id: int = None):
+        """Find a collection by exact name directly inside parent_id (None = root)"""
+        return self._collections_by_name_parent().get((name, parent_id))
     
     def find_database(self, name: str):
         """Find database by name with fuzzy matching"""
-        databases = self.get_databases()
-        db_names = [db['name'] for db in databases]
+        index = self._ensure_db_index()
         
         # Exact match (case-insensitive)
-        for db in databases:
-            if db['name'].lower() == name.lower():
-                return db, None
+        db = index.get(name.lower())
+        if db:
+            return db, None
         
         # Fuzzy match
-        close_matches = get_close_matches(name, db_names, n=5, cutoff=0.4)
+        db_names = [db['name'] for db in index.values()]
+        if fuzz_process is not None:
+            close_matches = [
+                match for match, score, _ in fuzz_process.extract(
+                    name, db_names, scorer=fuzz.WRatio, processor=str.lower,
+                    limit=5, score_cutoff=40
+                )
+            ]
+        else:
+            close_matches = get_close_matches(name, db_names, n=5, cutoff=0.4)
         return None, close_matches
     
     def find_collection(self, name: str):
         """Find collection by name"""
-        collections = self.get_collections()
-        for col in collections:
-            if col['name'].lower() == name.lower():
-                return col
-        return None
+        return self._ensure_collection_index().get(name.lower())
     
     def create_collection(self, name: str, parent_id: int = None) -> dict:
         """Create a new collection, optionally inside a parent collection"""
@@ -120,17 +669,17 @@ class DashboardCloner:
             if parent_id:
                 payload["parent_id"] = parent_id
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/collection",
-                headers=self.headers,
                 json=payload
             )
             response.raise_for_status()
-            created = response.json()
-            logger.info(f"Created collection: {name} (ID: {created['id']})")
+            created = _loads(response.content)
+            self.invalidate_collections_cache()  # Collection list changed
+            logger.info("Created collection: %s (ID: %s)", name, created['id'])
             return created
         except Exception as e:
-            logger.error(f"Failed to create collection: {e}")
+            logger.error("Failed to create collection: %s", e)
             return None
     
     def get_or_create_collection(self, name: str, parent_id: int = None) -> dict:
@@ -142,7 +691,7 @@ class DashboardCloner:
     
     def get_dashboard_collection_id(self, dashboard_id: int) -> int:
         """Get the collection ID where a dashboard is stored"""
-        dashboard = self.manager.get_dashboard(dashboard_id)
+        dashboard = self._get_dashboard(dashboard_id)
         if dashboard:
             return dashboard.get('collection_id')
         return None
@@ -150,41 +699,89 @@ class DashboardCloner:
     def get_database_schema(self, database_id: int) -> dict:
         """Get database schema (tables and fields)"""
         try:
-            response = requests.get(
-                f"{self.base_url}/api/database/{database_id}/metadata",
-                headers=self.headers
+            response = self.session.get(
+                f"{self.base_url}/api/database/{database_id}/metadata"
             )
             response.raise_for_status()
-            return response.json()
+            return _loads(response.content)
         except Exception as e:
-            logger.error(f"Failed to get database schema: {e}")
+            logger.error("Failed to get database schema: %s", e)
             return {}
     
+    def get_database_schema_index(self, database_id: int, use_disk_cache: bool = False) -> dict:
+        """
+        Get a compact schema index: {'tables': [{id, name, fields: [{id, name}]}]}.
+        The metadata response is stream-parsed with ijson when available, so only
+        one table is materialized at a time instead of the whole payload.
+        use_disk_cache is for the source database only - a target that was just
+        re-synced must never be read from the cache.
+        """
+        key = f"/api/database/{database_id}/metadata#index"
+        if use_disk_cache:
+            cached = self._disk_cache_get(key)
+            if cached is not None:
+                return cached
+        
+        url = f"{self.base_url}/api/database/{database_id}/metadata"
+        try:
+            if ijson is not None:
+                with self.session.get(url, stream=True) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    tables = [_schema_table_entry(t) for t in ijson.items(response.raw, 'tables.item')]
+            else:
+                response = self.session.get(url)
+                response.raise_for_status()
+                tables = [_schema_table_entry(t) for t in _loads(response.content).get('tables', [])]
+        except Exception as e:
+            logger.error("Failed to get database schema: %s", e)
+            return {}
+        
+        index = {'tables': tables}
+        if use_disk_cache and tables:  # Don't pin an empty (e.g. not yet synced) schema in the cache
+            self._disk_cache_put(key, index)
+        return index
+    
     def get_question(self, question_id: int) -> dict:
         """Get a question/card by ID"""
         try:
-            response = requests.get(
-                f"{self.base_url}/api/card/{question_id}",
-                headers=self.headers
-            )
+            client = self.http if self.http is not None else self.session
+            response = client.get(f"{self.base_url}/api/card/{question_id}")
             response.raise_for_status()
-            return response.json()
+            return _loads(response.content)
         except Exception as e:
-            logger.error(f"Failed to get question {question_id}: {e}")
+            logger.error("Failed to get question %s: %s", question_id, e)
             return None
     
+    def get_questions_bulk(self, question_ids: List[int]) -> Dict[int, dict]:
+        """
+        Fetch several questions at once. Returns {question_id: card}; questions
+        that could not be fetched are left out.
+        Metabase has no multi-id card endpoint, so the GETs are issued concurrently.
+        """
+        question_ids = list(dict.fromkeys(question_ids))
+        if not question_ids:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.clone_workers, len(question_ids))) as executor:
+            cards = executor.map(lambda qid: self._load_get('card', qid), question_ids)
+            return {qid: card for qid, card in zip(question_ids, cards) if card}
+    
     def build_table_field_mapping(self, source_db_id: int, target_db_id: int):
         """Build mapping between source and target database tables/fields by name"""
         logger.info("Building table and field mappings...")
         
-        source_schema = self.get_database_schema(source_db_id)
-        target_schema = self.get_database_schema(target_db_id)
+        # Source and target schemas are independent - fetch both at once
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            source_future = executor.submit(self.get_database_schema_index, source_db_id, True)
+            target_future = executor.submit(self.get_database_schema_index, target_db_id)
+            source_schema, target_schema = source_future.result(), target_future.result()
         
         if not source_schema or not target_schema:
             logger.warning("Could not build schema mappings")
             return
         
         # Build target table lookup by name (case-insensitive, also try without schema prefix)
+        # Field keys are (table_name, field_name) tuples - no per-field string building
         target_tables = {}
         target_fields = {}
         target_fields_by_name = {}  # Just field name without table
@@ -192,69 +789,73 @@ class DashboardCloner:
         for table in target_schema.get('tables', []):
             table_name = table['name'].lower()
             # Also store without schema prefix if present
-            simple_name = table_name.split('.')[-1] if '.' in table_name else table_name
+            simple_name = table_name.rpartition('.')[2]
+            table_id = table['id']
             
-            target_tables[table_name] = table['id']
-            target_tables[simple_name] = table['id']
+            target_tables[table_name] = table_id
+            target_tables[simple_name] = table_id
             
             for field in table.get('fields', []):
                 field_name = field['name'].lower()
-                field_key = f"{table_name}.{field_name}"
-                simple_key = f"{simple_name}.{field_name}"
+                field_id = field['id']
                 
-                target_fields[field_key] = field['id']
-                target_fields[simple_key] = field['id']
+                target_fields[(table_name, field_name)] = field_id
+                target_fields[(simple_name, field_name)] = field_id
                 
-                # Also store by just field name (for loose matching)
-                if field_name not in target_fields_by_name:
-                    target_fields_by_name[field_name] = field['id']
+                # Also store by just field name (for loose matching) - first seen wins
+                target_fields_by_name.setdefault(field_name, field_id)
         
         # Map source tables/fields to target
         unmapped_tables = []
         unmapped_fields = []
+        table_mapping = self.table_mapping
+        field_mapping = self.field_mapping
         
         for table in source_schema.get('tables', []):
             table_name = table['name'].lower()
-            simple_name = table_name.split('.')[-1] if '.' in table_name else table_name
+            simple_name = table_name.rpartition('.')[2]
             
             # Try to find matching target table
             target_id = target_tables.get(table_name) or target_tables.get(simple_name)
             
             if target_id:
-                self.table_mapping[table['id']] = target_id
+                table_mapping[table['id']] = target_id
                 
                 for field in table.get('fields', []):
                     field_name = field['name'].lower()
-                    field_key = f"{table_name}.{field_name}"
-                    simple_key = f"{simple_name}.{field_name}"
                     
                     # Try different matching strategies
                     target_field_id = (
-                        target_fields.get(field_key) or 
-                        target_fields.get(simple_key) or
+                        target_fields.get((table_name, field_name)) or 
+                        target_fields.get((simple_name, field_name)) or
                         target_fields_by_name.get(field_name)  # Fallback: just field name
                     )
                     
                     if target_field_id:
-                        self.field_mapping[field['id']] = target_field_id
+                        field_mapping[field['id']] = target_field_id
                     else:
                         unmapped_fields.append(f"{table_name}.{field_name}")
             else:
                 unmapped_tables.append(table_name)
         
-        logger.info(f"Mapped {len(self.table_mapping)} tables, {len(self.field_mapping)} fields")
+        logger.info("Mapped %s tables, %s fields", len(self.table_mapping), len(self.field_mapping))
         
         if unmapped_tables and len(unmapped_tables) <= 10:
-            logger.debug(f"Unmapped tables: {unmapped_tables[:10]}")
+            logger.debug("Unmapped tables: %s", unmapped_tables[:10])
         if unmapped_fields and len(unmapped_fields) <= 10:
-            logger.debug(f"Unmapped fields: {unmapped_fields[:10]}")
+            logger.debug("Unmapped fields: %s", unmapped_fields[:10])
     
     def remap_query(self, query: dict, new_database_id: int) -> dict:
         """Remap a query to use new database with proper table/field IDs"""
         if not query:
             return query
         
-        query = json.loads(json.dumps(query))  # Deep copy
+        # Nothing to remap - skip the deep copy entirely
+        if not self.field_mapping and not self.table_mapping and query.get('database') == new_database_id:
+            return query
+        
+        # Shallow copy only - nested subtrees stay shared unless a remap touches them
+        query = dict(query)
         
         # Update database
         if 'database' in query:
@@ -263,163 +864,242 @@ class DashboardCloner:
         # Handle MBQL v2 queries with 'stages' (newer Metabase format)
         # This format is used for MongoDB aggregation pipelines and newer queries
         if 'stages' in query and isinstance(query['stages'], list):
-            logger.info(f"    Processing MBQL v2 query with {len(query['stages'])} stages")
-            for stage in query['stages']:
-                if isinstance(stage, dict):
-                    # Remap source-table in stage
-                    if 'source-table' in stage:
-                        old_table = stage['source-table']
-                        if isinstance(old_table, int) and old_table in self.table_mapping:
-                            stage['source-table'] = self.table_mapping[old_table]
-                    
-                    # Remap fields recursively in the stage
-                    self._remap_fields_recursive(stage)
+            logger.info("    Processing MBQL v2 query with %s stages", len(query['stages']))
+            query['stages'] = [
+                self._remap_mbql(stage) if isinstance(stage, dict) else stage
+                for stage in query['stages']
+            ]
             return query
         
         # Handle traditional MBQL queries (type: "query")
-        if query.get('type') == 'query' and 'query' in query:
-            mbql = query['query']
-            
-            # Remap source-table
-            if 'source-table' in mbql:
-                old_table = mbql['source-table']
-                if isinstance(old_table, int) and old_table in self.table_mapping:
-                    mbql['source-table'] = self.table_mapping[old_table]
-            
-            # Remap fields recursively
-            self._remap_fields_recursive(mbql)
+        if query.get('type') == 'query' and isinstance(query.get('query'), dict):
+            query['query'] = self._remap_mbql(query['query'])
         
         # Handle native queries (type: "native") - just update database, query stays same
         # Native queries use collection/table names which should match across databases
         
         return query
     
-    def _remap_fields_recursive(self, obj):
-        """Recursively remap field references in any object"""
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                if isinstance(value, (dict, list)):
-                    self._remap_fields_recursive(value)
-        elif isinstance(obj, list):
-            # Check for field reference ["field", id, options] or ["field", "name", options]
-            if len(obj) >= 2 and obj[0] == "field":
-                field_ref = obj[1]
-                if isinstance(field_ref, int):
-                    if field_ref in self.field_mapping:
-                        obj[1] = self.field_mapping[field_ref]
-                    # else: keep original - might be a field name reference
-                elif isinstance(field_ref, str):
-                    # Field referenced by name - this usually works across databases
-                    pass
+    def _remap_mbql(self, mbql: dict) -> dict:
+        """Remap source-table and field references of one MBQL query/stage (copy-on-write)"""
+        new_mbql, _ = self._rewrite(mbql)
+        
+        old_table = mbql.get('source-table')
+        if isinstance(old_table, int) and old_table in self.table_mapping:
+            if new_mbql is mbql:
+                new_mbql = dict(mbql)
+            new_mbql['source-table'] = self.table_mapping[old_table]
+        
+        return new_mbql
+    
+    def _rewrite(self, node):
+        """
+        Copy-on-write field remap. Returns (new_node, changed).
+        Subtrees without remapped field references are returned as the same
+        object, so only the path from a changed leaf up to the root is copied.
+        """
+        if isinstance(node, list):
+            # Field reference ["field", id, options] or ["field", "name", options]
+            if len(node) >= 2 and node[0] == "field":
+                field_map = self.field_mapping
+                field_ref = node[1]
+                # Field referenced by name usually works across databases - keep it
+                ref_changed = isinstance(field_ref, int) and field_ref in field_map
                 
                 # Check source-field in options
-                if len(obj) > 2 and isinstance(obj[2], dict):
-                    if 'source-field' in obj[2]:
-                        src = obj[2]['source-field']
-                        if isinstance(src, int) and src in self.field_mapping:
-                            obj[2]['source-field'] = self.field_mapping[src]
-                    # Also check base-type and other options
-            else:
-                for item in obj:
-                    if isinstance(item, (dict, list)):
-                        self._remap_fields_recursive(item)
-    
-    def remap_click_behavior(self, viz_settings: dict, tab_mapping: dict = None) -> dict:
-        """Remap click behavior to point to new dashboards/questions/tabs"""
+                opts = node[2] if len(node) > 2 else None
+                src = opts.get('source-field') if isinstance(opts, dict) else None
+                opts_changed = isinstance(src, int) and src in field_map
+                
+                if not ref_changed and not opts_changed:
+                    return node, False
+                
+                new_node = list(node)
+                if ref_changed:
+                    new_node[1] = field_map[field_ref]
+                if opts_changed:
+                    new_node[2] = {**opts, 'source-field': field_map[src]}
+                return new_node, True
+            
+            new_list = None
+            for i, item in enumerate(node):
+                if isinstance(item, (dict, list)):
+                    new_item, changed = self._rewrite(item)
+                    if changed:
+                        if new_list is None:
+                            new_list = list(node)
+                        new_list[i] = new_item
+            return (node, False) if new_list is None else (new_list, True)
+        
+        if isinstance(node, dict):
+            new_dict = None
+            for key, value in node.items():
+                if isinstance(value, (dict, list)):
+                    new_value, changed = self._rewrite(value)
+                    if changed:
+                        if new_dict is None:
+                            new_dict = dict(node)
+                        new_dict[key] = new_value
+            return (node, False) if new_dict is None else (new_dict, True)
+        
+        return node, False
+    
+    def _click_remap_tables(self, tab_mapping: dict = None) -> dict:
+        """Bundle the lookup tables click behavior remapping reads, built once per pass"""
+        return {
+            'dashboards': self.dashboard_mapping,
+            'questions': self.question_mapping,
+            'tabs': tab_mapping,
+            'per_dash_tabs': self.dashboard_tab_mappings,
+        }
+    
+    def remap_click_behavior(self, viz_settings: dict, tab_mapping: dict = None,
+                             remap: dict = None) -> tuple:
+        """Remap click behavior to point to new dashboards/questions/tabs.
+        Returns (viz_settings, changed) - the input is returned as-is when nothing needs remapping.
+        remap (from _click_remap_tables) replaces tab_mapping when given."""
         if not viz_settings:
-            return viz_settings
+            return viz_settings, False
+        
+        # Most dashcards have no click behavior at all - return them untouched
+        has_click_behavior = (
+            'click_behavior' in viz_settings
+            or isinstance(viz_settings.get('click'), dict)
+            or any(isinstance(cs, dict) and 'click_behavior' in cs
+                   for cs in (viz_settings.get('column_settings') or {}).values())
+        )
+        if not has_click_behavior:
+            return viz_settings, False
         
-        viz_settings = json.loads(json.dumps(viz_settings))  # Deep copy
+        viz_settings = copy.deepcopy(viz_settings)
+        changed = False
+        if remap is None:
+            remap = self._click_remap_tables(tab_mapping)
         
         # Handle top-level click_behavior (only once!)
         if 'click_behavior' in viz_settings:
-            self._remap_single_click_behavior(viz_settings['click_behavior'], tab_mapping)
+            changed |= self._remap_single_click_behavior(viz_settings['click_behavior'], remap=remap)
         
         # Handle column-specific click behaviors (in column_settings)
         if 'column_settings' in viz_settings:
             for col_key, col_settings in viz_settings['column_settings'].items():
                 if 'click_behavior' in col_settings:
-                    self._remap_single_click_behavior(col_settings['click_behavior'], tab_mapping)
+                    changed |= self._remap_single_click_behavior(col_settings['click_behavior'], remap=remap)
         
         # Handle 'click' key (different from 'click_behavior') for graph.dimensions, etc.
         # NOTE: Don't process 'click_behavior' again - it was already handled above!
         if 'click' in viz_settings and isinstance(viz_settings['click'], dict):
-            self._remap_single_click_behavior(viz_settings['click'], tab_mapping)
+            changed |= self._remap_single_click_behavior(viz_settings['click'], remap=remap)
         
-        return viz_settings
+        return viz_settings, changed
     
-    def _remap_single_click_behavior(self, click_behavior: dict, tab_mapping: dict = None):
-        """Remap a single click behavior object"""
+    def _remap_single_click_behavior(self, click_behavior: dict, tab_mapping: dict = None,
+                                     remap: dict = None) -> bool:
+        """Remap a single click behavior object in place. Returns True if anything changed"""
         if not click_behavior or not isinstance(click_behavior, dict):
-            return
+            return False
+        
+        changed = False
+        
+        # Remap parameter mappings within click behavior (applies to every link type)
+        if 'parameterMapping' in click_behavior:
+            changed = self._remap_click_parameter_mapping(click_behavior['parameterMapping'])
         
         link_type = click_behavior.get('linkType')
+        if link_type not in ('dashboard', 'question'):
+            return changed
+        
         target_id = click_behavior.get('targetId')
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
+        if debug:
+            logger.debug("    Processing click_behavior: linkType=%s, targetId=%s, tabId=%s", link_type, target_id, click_behavior.get('tabId'))
         
-        logger.debug(f"    Processing click_behavior: linkType={link_type}, targetId={target_id}, tabId={click_behavior.get('tabId')}")
+        if not target_id:
+            return changed
         
-        if link_type == 'dashboard' and target_id:
+        if remap is None:
+            remap = self._click_remap_tables(tab_mapping)
+        
+        if link_type == 'dashboard':
+            dm = remap['dashboards']
+            dtm = remap['per_dash_tabs']
+            tab_mapping = remap['tabs']
+            
             # Remap to new dashboard (including self-references)
             new_target = target_id
-            if target_id in self.dashboard_mapping:
-                new_target = self.dashboard_mapping[target_id]
+            if target_id in dm:
+                new_target = dm[target_id]
                 click_behavior['targetId'] = new_target
                 if target_id == new_target:
-                    logger.debug(f"    Dashboard link unchanged: {target_id}")
+                    if debug:
+                        logger.debug("    Dashboard link unchanged: %s", target_id)
                 else:
-                    logger.info(f"    Remapped dashboard link: {target_id} -> {new_target}")
+                    changed = True
+                    logger.info("    Remapped dashboard link: %s -> %s", target_id, new_target)
             
             # Remap tab ID if present (dashboard tab navigation)
             if 'tabId' in click_behavior:
                 old_tab_id = click_behavior['tabId']
                 
-                logger.info(f"    Tab remapping: old_tab_id={old_tab_id}, new_target={new_target}")
-                logger.info(f"    Available dashboard_tab_mappings: {self.dashboard_tab_mappings}")
+                if debug:
+                    logger.debug("    Tab remapping: old_tab_id=%s, new_target=%s", old_tab_id, new_target)
+                    logger.debug("    Available dashboard_tab_mappings: %s", dtm)
                 
                 # First, try to get the tab mapping for the TARGET dashboard
                 # This is important when a dashboard links to itself or another cloned dashboard
                 effective_tab_mapping = None
                 
                 # Check if we have a specific tab mapping for the target dashboard
-                if new_target in self.dashboard_tab_mappings:
-                    effective_tab_mapping = self.dashboard_tab_mappings[new_target]
-                    logger.info(f"    Found tab mapping for target dashboard {new_target}: {effective_tab_mapping}")
+                if new_target in dtm:
+                    effective_tab_mapping = dtm[new_target]
+                    if debug:
+                        logger.debug("    Found tab mapping for target dashboard %s: %s", new_target, effective_tab_mapping)
                 elif tab_mapping:
                     # Fall back to provided tab_mapping (for backward compatibility)
                     effective_tab_mapping = tab_mapping
-                    logger.info(f"    Using fallback tab_mapping: {effective_tab_mapping}")
+                    if debug:
+                        logger.debug("    Using fallback tab_mapping: %s", effective_tab_mapping)
                 
                 if effective_tab_mapping:
                     # Check if tabId needs remapping (is it a key in the mapping?)
                     if old_tab_id in effective_tab_mapping:
                         click_behavior['tabId'] = effective_tab_mapping[old_tab_id]
-                        logger.info(f"    Remapped tab link: {old_tab_id} -> {effective_tab_mapping[old_tab_id]}")
+                        changed = changed or effective_tab_mapping[old_tab_id] != old_tab_id
+                        logger.info("    Remapped tab link: %s -> %s", old_tab_id, effective_tab_mapping[old_tab_id])
                     elif old_tab_id in effective_tab_mapping.values():
                         # tabId is already a NEW tab ID (already remapped) - don't touch it!
-                        logger.info(f"    Tab {old_tab_id} is already a new tab ID - skipping remap")
+                        logger.info("    Tab %s is already a new tab ID - skipping remap", old_tab_id)
                     else:
                         # Tab ID not in mapping as key or value - it's invalid, clear it
-                        logger.warning(f"    Tab {old_tab_id} not found in mapping for dashboard {new_target} - clearing tabId")
+                        logger.warning("    Tab %s not found in mapping for dashboard %s - clearing tabId", old_tab_id, new_target)
                         del click_behavior['tabId']
+                        changed = True
                 else:
-                    logger.warning(f"    No tab mapping available for dashboard {new_target} - keeping original tabId {old_tab_id}")
+                    logger.warning("    No tab mapping available for dashboard %s - keeping original tabId %s", new_target, old_tab_id)
         
-        elif link_type == 'question' and target_id:
+        else:
             # Remap to new question
-            if target_id in self.question_mapping:
-                click_behavior['targetId'] = self.question_mapping[target_id]
-                logger.info(f"    Remapped question link: {target_id} -> {self.question_mapping[target_id]}")
-        
-        # Remap parameter mappings within click behavior
-        if 'parameterMapping' in click_behavior:
-            param_mapping = click_behavior['parameterMapping']
-            for param_id, mapping in param_mapping.items():
-                if 'source' in mapping and isinstance(mapping['source'], dict):
-                    source = mapping['source']
-                    if source.get('type') == 'column':
-                        # Remap field ID if present
-                        if 'id' in source and isinstance(source['id'], list):
-                            self._remap_fields_recursive(source['id'])
+            qm = remap['questions']
+            if target_id in qm:
+                click_behavior['targetId'] = qm[target_id]
+                changed = changed or qm[target_id] != target_id
+                logger.info("    Remapped question link: %s -> %s", target_id, qm[target_id])
+        
+        return changed
+    
+    def _remap_click_parameter_mapping(self, param_mapping: dict) -> bool:
+        """Remap field IDs in a click behavior's parameterMapping. Returns True if anything changed"""
+        changed = False
+        for param_id, mapping in param_mapping.items():
+            if 'source' in mapping and isinstance(mapping['source'], dict):
+                source = mapping['source']
+                if source.get('type') == 'column':
+                    # Remap field ID if present
+                    if 'id' in source and isinstance(source['id'], list):
+                        source['id'], id_changed = self._rewrite(source['id'])
+                        changed |= id_changed
+        return changed
     
     def remap_parameter_mappings(self, mappings: list, new_card_id: int) -> list:
         """Remap parameter mappings with new card ID and field IDs"""
@@ -428,20 +1108,22 @@ class DashboardCloner:
         
         remapped = []
         for mapping in mappings:
-            mapping_copy = json.loads(json.dumps(mapping))
-            mapping_copy['card_id'] = new_card_id
+            # Shallow copy - the target is rewritten copy-on-write, nothing nested is mutated
+            mapping_copy = {**mapping, 'card_id': new_card_id}
             
             # Remap target field
             target = mapping_copy.get('target', [])
             if target:
-                old_target = json.dumps(target)
-                self._remap_fields_recursive(target)
-                new_target = json.dumps(target)
-                if old_target != new_target:
-                    logger.debug(f"    Remapped parameter target: {old_target[:50]} -> {new_target[:50]}")
-                elif 'field' in old_target:
-                    # Field wasn't remapped - might cause issues
-                    logger.warning(f"    Could not remap parameter field in: {old_target[:80]}")
+                new_target, changed = self._rewrite(target)
+                if changed:
+                    mapping_copy['target'] = new_target
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("    Remapped parameter target: %s -> %s", json.dumps(target)[:50], json.dumps(new_target)[:50])
+                else:
+                    old_target = _dumps(target)
+                    if b'field' in old_target:
+                        # Field wasn't remapped - might cause issues
+                        logger.warning("    Could not remap parameter field in: %s", old_target[:80].decode('utf-8', 'replace'))
             
             remapped.append(mapping_copy)
         return remapped
@@ -456,9 +1138,12 @@ class DashboardCloner:
         if not parameters:
             return []
         
+        if not any('values_source_config' in p for p in parameters):
+            return parameters
+        
         remapped = []
         for param in parameters:
-            param_copy = json.loads(json.dumps(param))  # Deep copy
+            param_copy = copy.deepcopy(param)
             
             # Check for values_source_config with card_id
             values_source = param_copy.get('values_source_config', {})
@@ -467,14 +1152,14 @@ class DashboardCloner:
                 if old_card_id in self.question_mapping:
                     new_card_id = self.question_mapping[old_card_id]
                     values_source['card_id'] = new_card_id
-                    logger.info(f"  Remapped filter '{param_copy.get('name', 'Unknown')}' values_source: card {old_card_id} -> {new_card_id}")
+                    logger.info("  Remapped filter '%s' values_source: card %s -> %s", param_copy.get('name', 'Unknown'), old_card_id, new_card_id)
                 else:
-                    logger.warning(f"  Filter '{param_copy.get('name', 'Unknown')}' references card {old_card_id} which wasn't cloned")
+                    logger.warning("  Filter '%s' references card %s which wasn't cloned", param_copy.get('name', 'Unknown'), old_card_id)
             
             # Also check for values_query_type = "card" which indicates card-based values
             if param_copy.get('values_query_type') == 'card' and values_source:
                 # Already handled above, but log for debugging
-                logger.debug(f"  Filter '{param_copy.get('name', 'Unknown')}' uses card-based values")
+                logger.debug("  Filter '%s' uses card-based values", param_copy.get('name', 'Unknown'))
             
             remapped.append(param_copy)
         
@@ -493,16 +1178,16 @@ class DashboardCloner:
         if not parameters:
             return []
         
-        question_ids = []
+        question_ids = {}  # insertion-ordered set
         for param in parameters:
             values_source = param.get('values_source_config', {})
             if values_source and 'card_id' in values_source:
                 card_id = values_source['card_id']
                 if card_id and card_id not in question_ids:
-                    question_ids.append(card_id)
-                    logger.info(f"  Found filter-linked question: {card_id} (for filter '{param.get('name', 'Unknown')}')")
+                    question_ids[card_id] = None
+                    logger.info("  Found filter-linked question: %s (for filter '%s')", card_id, param.get('name', 'Unknown'))
         
-        return question_ids
+        return list(question_ids)
     
     def clone_filter_linked_questions(self, parameters: list, new_database_id: int, 
                                        collection_id: int = None) -> dict:
@@ -520,207 +1205,254 @@ class DashboardCloner:
         if not question_ids:
             return {}
         
-        logger.info(f"\n--- Cloning {len(question_ids)} filter-linked questions ---")
+        logger.info("\n--- Cloning %s filter-linked questions ---", len(question_ids))
         
         cloned_mapping = {}
+        pending = []
         for question_id in question_ids:
             if question_id in self.question_mapping:
-                logger.info(f"  Question {question_id} already cloned, skipping")
+                logger.info("  Question %s already cloned, skipping", question_id)
                 continue
-            
-            # Get the original question to find its name
-            original = self.get_question(question_id)
+            pending.append(question_id)
+        
+        # Fetch all originals up front (names are needed before cloning)
+        originals = self.get_questions_bulk(pending)
+        
+        def clone_one(question_id):
+            original = originals.get(question_id)
             if not original:
-                logger.warning(f"  Could not fetch filter-linked question {question_id}")
-                continue
+                logger.warning("  Could not fetch filter-linked question %s", question_id)
+                return question_id, None, None
             
             original_name = original.get('name', f'Filter Question {question_id}')
-            
-            # Clone the question
-            cloned = self.clone_question(
+            cloned = self._clone_question_once(
                 question_id=question_id,
                 new_name=original_name,
                 new_database_id=new_database_id,
-                collection_id=collection_id
+                collection_id=collection_id,
+                original=original
             )
-            
-            if cloned:
-                cloned_mapping[question_id] = cloned['id']
-                self.question_mapping[question_id] = cloned['id']
-                logger.info(f"  + Cloned filter question: {original_name} ({question_id} -> {cloned['id']})")
-            else:
-                logger.error(f"  x Failed to clone filter question {question_id}")
+            return question_id, original_name, cloned
+        
+        with ThreadPoolExecutor(max_workers=self.clone_workers) as executor:
+            futures = [_submit(executor, clone_one, qid) for qid in pending]
+            for future in as_completed(futures):
+                question_id, original_name, cloned = future.result()
+                if original_name is None:
+                    continue
+                if cloned:
+                    cloned_mapping[question_id] = cloned['id']
+                    logger.info("  + Cloned filter question: %s (%s -> %s)", original_name, question_id, cloned['id'])
+                else:
+                    logger.error("  x Failed to clone filter question %s", question_id)
         
         return cloned_mapping
     
+    def _clone_question_once(self, question_id: int, **kwargs) -> dict:
+        """
+        clone_question, deduplicated across threads: when another dashboard is already
+        cloning the same question, wait for its result instead of creating a duplicate.
+        Records the result in question_mapping.
+        """
+        with self._lock:
+            if question_id in self.question_mapping:
+                return {'id': self.question_mapping[question_id]}
+            future = self._inflight_questions.get(question_id)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight_questions[question_id] = future
+        
+        if not owner:
+            return future.result()
+        
+        try:
+            cloned = self.clone_question(question_id=question_id, **kwargs)
+            if cloned:
+                with self._lock:
+                    self.question_mapping[question_id] = cloned['id']
+            future.set_result(cloned)
+            return cloned
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight_questions.pop(question_id, None)
+    
     def clone_question(self, question_id: int, new_name: str, 
                       new_database_id: int, collection_id: int = None,
-                      max_retries: int = 3) -> dict:
+                      max_retries: int = 3, original: dict = None) -> dict:
         """Clone a question with remapped database/tables/fields.
-        Includes automatic retry mechanism for intermittent failures."""
-        import uuid
-        import time
+        Includes automatic retry mechanism for intermittent failures.
+        Pass `original` when the source card was already fetched to skip the GET."""
         
         # Check if stop requested before starting
         self.check_stop_requested()
         
+        # Fetch and remap once - retries only re-issue the POST
+        if original is None:
+            original = self._load_get('card', question_id)
+        if not original:
+            logger.error("  x Could not fetch original question %s", question_id)
+            return None
+        
+        try:
+            logger.debug("    Original question type: %s", original.get('dataset_query', {}).get('type', 'unknown'))
+            
+            # Remap the query
+            new_query = self.remap_query(original.get('dataset_query', {}), new_database_id)
+            
+            # IMPORTANT: Regenerate template tag IDs to avoid conflicts
+            # Template tags can be in different locations depending on query format
+            new_query = self._regenerate_template_tag_ids(new_query)
+            
+            # Remap visualization settings (including click behavior)
+            new_viz_settings, _ = self.remap_click_behavior(original.get('visualization_settings', {}))
+        except Exception as e:
+            logger.error("  x Failed to remap question %s: %s", question_id, e)
+            traceback.print_exc()
+            return None
+        
+        # Build new question
+        new_question = {
+            "name": new_name,
+            "dataset_query": new_query,
+            "display": original.get('display', 'table'),
+            "visualization_settings": new_viz_settings,
+            "description": original.get('description', '')
+        }
+        
+        if collection_id:
+            new_question['collection_id'] = collection_id
+        
         for attempt in range(1, max_retries + 1):
             try:
-                # Get original question
-                original = self.get_question(question_id)
-                if not original:
-                    logger.error(f"  x Could not fetch original question {question_id}")
-                    return None
-                
-                logger.debug(f"    Original question type: {original.get('dataset_query', {}).get('type', 'unknown')}")
-                
-                # Remap the query
-                new_query = self.remap_query(original.get('dataset_query', {}), new_database_id)
-                
-                # IMPORTANT: Regenerate template tag IDs to avoid conflicts
-                # Template tags can be in different locations depending on query format
-                self._regenerate_template_tag_ids(new_query)
-                
-                # Remap visualization settings (including click behavior)
-                new_viz_settings = self.remap_click_behavior(original.get('visualization_settings', {}))
-                
-                # Build new question
-                new_question = {
-                    "name": new_name,
-                    "dataset_query": new_query,
-                    "display": original.get('display', 'table'),
-                    "visualization_settings": new_viz_settings,
-                    "description": original.get('description', '')
-                }
-                
-                if collection_id:
-                    new_question['collection_id'] = collection_id
-                
                 # Create the question
-                response = requests.post(
-                    f"{self.base_url}/api/card",
-                    headers=self.headers,
-                    json=new_question
-                )
+                response = self._post_json(f"{self.base_url}/api/card", new_question)
                 
                 if response.status_code != 200:
-                    error_detail = response.text[:500] if response.text else "No error details"
-                    logger.error(f"  x API error {response.status_code} for question {question_id}: {error_detail}")
-                    if attempt < max_retries:
-                        logger.info(f"    Retrying in {attempt * 2} seconds...")
-                        time.sleep(attempt * 2)
-                        continue
-                    return None
+                    raise requests.exceptions.HTTPError(f"API error {response.status_code}", response=response)
                 
-                response.raise_for_status()
-                created = response.json()
-                logger.info(f"  + Cloned question: {new_name} (ID: {created['id']})")
+                created = _loads(response.content)
+                logger.info("  + Cloned question: %s (ID: %s)", new_name, created['id'])
                 return created
             
             except requests.exceptions.HTTPError as e:
-                error_detail = e.response.text[:500] if e.response and e.response.text else str(e)
+                response = e.response
+                status = response.status_code if response is not None else None
+                error_detail = response.text[:500] if response is not None and response.text else str(e)
+                
+                # Client errors won't succeed on retry (except rate limiting)
+                if status is not None and status < 500 and status != 429:
+                    logger.error("  x API error %s for question %s: %s", status, question_id, error_detail)
+                    return None
+                
                 if attempt < max_retries:
-                    logger.warning(f"  ! Attempt {attempt}/{max_retries} failed for question {question_id}: {error_detail}")
-                    logger.info(f"    Retrying in {attempt * 2} seconds...")
-                    time.sleep(attempt * 2)
+                    delay = _retry_delay(attempt, response)
+                    logger.warning("  ! Attempt %s/%s failed for question %s: %s", attempt, max_retries, question_id, error_detail)
+                    logger.info("    Retrying in %.1f seconds...", delay)
+                    time.sleep(delay)
                 else:
-                    logger.error(f"  x Failed to clone question {question_id} after {max_retries} attempts: {error_detail}")
+                    logger.error("  x Failed to clone question %s after %s attempts: %s", question_id, max_retries, error_detail)
                     return None
             
             except Exception as e:
                 if attempt < max_retries:
-                    logger.warning(f"  ! Attempt {attempt}/{max_retries} failed for question {question_id}: {e}")
-                    logger.info(f"    Retrying in {attempt * 2} seconds...")
-                    time.sleep(attempt * 2)
+                    delay = _retry_delay(attempt)
+                    logger.warning("  ! Attempt %s/%s failed for question %s: %s", attempt, max_retries, question_id, e)
+                    logger.info("    Retrying in %.1f seconds...", delay)
+                    time.sleep(delay)
                 else:
-                    logger.error(f"  x Failed to clone question {question_id} after {max_retries} attempts: {e}")
-                    import traceback
+                    logger.error("  x Failed to clone question %s after %s attempts: %s", question_id, max_retries, e)
                     traceback.print_exc()
                     return None
         
         return None
     
-    def _regenerate_template_tag_ids(self, query: dict):
-        """Regenerate UUIDs for all template tags and remap field IDs in dimensions"""
-        import uuid
-        
+    def _regenerate_template_tag_ids(self, query: dict) -> dict:
+        """
+        Regenerate UUIDs for all template tags and remap field IDs in dimensions.
+        Returns a new query - only the containers holding template tags are copied,
+        so the input (which may be shared with the source card) is never mutated.
+        """
         if not query:
-            return
-        
-        def process_template_tags(template_tags: dict):
-            """Process template tags - regenerate IDs and remap field dimensions"""
-            for tag_name, tag_info in template_tags.items():
-                if not isinstance(tag_info, dict):
-                    continue
-                
-                # Regenerate the tag's own ID
-                if 'id' in tag_info:
-                    old_id = tag_info['id']
-                    tag_info['id'] = str(uuid.uuid4())
-                    logger.debug(f"    Regenerated template tag '{tag_name}' ID")
-                
-                # IMPORTANT: Remap field IDs in dimension references (Field Filters)
-                # Format: ["field", {"lib/uuid": "..."}, FIELD_ID] or ["field", FIELD_ID, {...}]
-                if 'dimension' in tag_info and isinstance(tag_info['dimension'], list):
-                    dimension = tag_info['dimension']
-                    if len(dimension) >= 2 and dimension[0] == 'field':
-                        # Regenerate lib/uuid if present
-                        if len(dimension) >= 2 and isinstance(dimension[1], dict) and 'lib/uuid' in dimension[1]:
-                            dimension[1]['lib/uuid'] = str(uuid.uuid4())
-                        
-                        # Remap field ID - it could be at index 1 (old format) or index 2 (new format)
-                        for i in range(1, len(dimension)):
-                            if isinstance(dimension[i], int):
-                                old_field_id = dimension[i]
-                                if old_field_id in self.field_mapping:
-                                    dimension[i] = self.field_mapping[old_field_id]
-                                    logger.info(f"    Remapped field filter '{tag_name}': {old_field_id} -> {dimension[i]}")
-                                else:
-                                    logger.warning(f"    Could not remap field filter '{tag_name}': field {old_field_id} not in mapping")
-                                break
+            return query
         
         # Handle 'native' format (older Metabase)
-        if 'native' in query and isinstance(query['native'], dict):
-            template_tags = query['native'].get('template-tags', {})
-            process_template_tags(template_tags)
+        native = query.get('native')
+        if isinstance(native, dict) and native.get('template-tags'):
+            query = {**query, 'native': self._rewrite_tags(native)}
         
         # Handle 'stages' format (newer Metabase MBQL v2)
-        if 'stages' in query and isinstance(query['stages'], list):
-            for stage in query['stages']:
-                if isinstance(stage, dict):
-                    template_tags = stage.get('template-tags', {})
-                    process_template_tags(template_tags)
+        stages = query.get('stages')
+        if isinstance(stages, list) and any(isinstance(st, dict) and st.get('template-tags') for st in stages):
+            query = {**query, 'stages': [
+                self._rewrite_tags(st) if isinstance(st, dict) and st.get('template-tags') else st
+                for st in stages
+            ]}
+        
+        return query
+    
+    def _rewrite_tags(self, container: dict) -> dict:
+        """Return a copy of a native/stage dict with its template-tags regenerated and remapped"""
+        debug = logger.isEnabledFor(logging.DEBUG)
+        field_map = self.field_mapping
+        
+        new_tags = {}
+        for tag_name, tag_info in container['template-tags'].items():
+            if not isinstance(tag_info, dict):
+                new_tags[tag_name] = tag_info
+                continue
+            tag_info = dict(tag_info)
+            
+            # Regenerate the tag's own ID
+            if 'id' in tag_info:
+                tag_info['id'] = str(_uuid4())
+                if debug:
+                    logger.debug("    Regenerated template tag '%s' ID", tag_name)
+            
+            # IMPORTANT: Remap field IDs in dimension references (Field Filters)
+            # Format: ["field", {"lib/uuid": "..."}, FIELD_ID] or ["field", FIELD_ID, {...}]
+            dimension = tag_info.get('dimension')
+            if isinstance(dimension, list) and len(dimension) >= 2 and dimension[0] == 'field':
+                dimension = list(dimension)
+                
+                # Regenerate lib/uuid if present
+                if isinstance(dimension[1], dict) and 'lib/uuid' in dimension[1]:
+                    dimension[1] = {**dimension[1], 'lib/uuid': str(_uuid4())}
+                
+                # Remap field ID - it could be at index 1 (old format) or index 2 (new format)
+                for i in range(1, len(dimension)):
+                    if isinstance(dimension[i], int):
+                        old_field_id = dimension[i]
+                        if old_field_id in field_map:
+                            dimension[i] = field_map[old_field_id]
+                            logger.info("    Remapped field filter '%s': %s -> %s", tag_name, old_field_id, dimension[i])
+                        else:
+                            logger.warning("    Could not remap field filter '%s': field %s not in mapping", tag_name, old_field_id)
+                        break
+                
+                tag_info['dimension'] = dimension
+            
+            new_tags[tag_name] = tag_info
+        
+        return {**container, 'template-tags': new_tags}
     
     def add_dashcards_with_tabs(self, dashboard_id: int, dashcards: List[dict], 
-                                  tabs: List[dict], source_tabs: List[dict]) -> tuple:
+                                  tabs: List[dict], source_tabs: List[dict],
+                                  parameters: List[dict] = None) -> tuple:
         """
-        Add cards AND tabs to dashboard in a single atomic request.
-        Returns (success, tab_mapping) where tab_mapping is old_tab_id -> new_tab_id
+        Add cards AND tabs (and optionally dashboard parameters) in a single atomic request.
+        Returns (success, tab_mapping, dashboard, params_applied) where tab_mapping is
+        old_tab_id -> new_tab_id, dashboard is the updated dashboard from the PUT response
+        (None if unavailable) and params_applied tells whether the parameters were written
+        (False when Metabase rejected the combined update - the caller applies them then)
         """
+        params_applied = False
         try:
-            # Build dashcards payload
-            cards_payload = []
-            for i, dc in enumerate(dashcards):
-                card_payload = {
-                    "id": -(i + 1),  # Negative IDs for new cards
-                    "card_id": dc['card_id'],
-                    "row": dc.get('row', 0),
-                    "col": dc.get('col', 0),
-                    "size_x": dc.get('size_x', 4),
-                    "size_y": dc.get('size_y', 4),
-                    "parameter_mappings": dc.get('parameter_mappings', []),
-                    "visualization_settings": dc.get('visualization_settings', {}),
-                }
-                
-                # Add tab ID if present (using the negative ID we pre-mapped)
-                if dc.get('dashboard_tab_id'):
-                    card_payload['dashboard_tab_id'] = dc['dashboard_tab_id']
-                
-                # Add series if present
-                if dc.get('series'):
-                    card_payload['series'] = dc['series']
-                
-                cards_payload.append(card_payload)
+            # Build dashcards payload (tab IDs are the negative IDs pre-mapped by the caller)
+            cards_payload = [_new_dashcard_payload(i, dc) for i, dc in enumerate(dashcards)]
             
             # Build update payload with BOTH tabs and dashcards
             update_payload = {
@@ -729,53 +1461,70 @@ class DashboardCloner:
             
             if tabs:
                 update_payload['tabs'] = tabs
-                logger.info(f"  Including {len(tabs)} tabs in update")
+                logger.info("  Including %s tabs in update", len(tabs))
             
-            logger.info(f"  Updating dashboard with {len(cards_payload)} cards...")
+            if parameters:
+                update_payload['parameters'] = parameters
+                logger.info("  Including %s dashboard filters in update", len(parameters))
             
-            response = requests.put(
-                f"{self.base_url}/api/dashboard/{dashboard_id}",
-                headers=self.headers,
-                json=update_payload
-            )
+            logger.info("  Updating dashboard with %s cards...", len(cards_payload))
+            
+            url = f"{self.base_url}/api/dashboard/{dashboard_id}"
+            response = self._put_json(url, update_payload)
+            self._invalidate_load('dashboard', dashboard_id)
+            
+            # Older Metabase versions may reject the combined update - retry without the
+            # filters and leave them to the caller's separate PUT
+            if response.status_code == 400 and parameters:
+                logger.warning("  Combined update rejected - filters will be applied separately")
+                del update_payload['parameters']
+                response = self._put_json(url, update_payload)
             response.raise_for_status()
+            params_applied = 'parameters' in update_payload
+            
+            # Metabase returns the updated dashboard from the PUT - read tab IDs from it
+            # and only fall back to a separate GET if the response omits them
+            try:
+                updated_dash = _loads(response.content)
+            except ValueError:
+                updated_dash = None
+            if not isinstance(updated_dash, dict):
+                updated_dash = None
             
-            # Get the dashboard to retrieve actual tab IDs
             tab_mapping = {}
             if tabs and source_tabs:
-                get_response = requests.get(
-                    f"{self.base_url}/api/dashboard/{dashboard_id}",
-                    headers=self.headers
-                )
-                get_response.raise_for_status()
-                updated_dash = get_response.json()
-                created_tabs = updated_dash.get('tabs', [])
+                created_tabs = updated_dash.get('tabs') if updated_dash else None
+                
+                if not created_tabs or len(created_tabs) != len(source_tabs):
+                    updated_dash = self._get_dashboard_layout(dashboard_id)
+                    created_tabs = updated_dash.get('tabs', [])
                 
                 if len(created_tabs) == len(source_tabs):
                     for orig_tab, new_tab in zip(source_tabs, created_tabs):
                         tab_mapping[orig_tab['id']] = new_tab['id']
-                        logger.info(f"  Tab created: {orig_tab.get('name')} ({orig_tab['id']} -> {new_tab['id']})")
+                        logger.info("  Tab created: %s (%s -> %s)", orig_tab.get('name'), orig_tab['id'], new_tab['id'])
                 else:
                     # Match by name as fallback
-                    created_by_name = {t.get('name', '').lower(): t['id'] for t in created_tabs}
-                    for orig_tab in source_tabs:
-                        name = orig_tab.get('name', '').lower()
-                        if name in created_by_name:
-                            tab_mapping[orig_tab['id']] = created_by_name[name]
+                    created_by_name = {(t.get('name') or '').lower(): t['id'] for t in created_tabs}
+                    source_lower = [((t.get('name') or '').lower(), t['id']) for t in source_tabs]
+                    for lname, old_id in source_lower:
+                        new_id = created_by_name.get(lname)
+                        if new_id is not None:
+                            tab_mapping[old_id] = new_id
                 
-                logger.info(f"  Created {len(created_tabs)} tabs")
+                logger.info("  Created %s tabs", len(created_tabs))
             
-            logger.info(f"  + Added {len(cards_payload)} cards via dashboard update")
-            return True, tab_mapping
+            logger.info("  + Added %s cards via dashboard update", len(cards_payload))
+            return True, tab_mapping, updated_dash, params_applied
             
         except Exception as e:
-            logger.error(f"  x Failed to add cards with tabs: {e}")
+            logger.error("  x Failed to add cards with tabs: %s", e)
             if hasattr(e, 'response') and e.response is not None:
                 try:
-                    logger.error(f"  Response: {e.response.text[:500]}")
+                    logger.error("  Response: %s", e.response.text[:500])
                 except:
                     pass
-            return False, {}
+            return False, {}, None, params_applied
     
     def add_dashcards_via_dashboard_update(self, dashboard_id: int, dashcards: List[dict]) -> bool:
         """
@@ -785,38 +1534,10 @@ class DashboardCloner:
         """
         try:
             # First get current dashboard state
-            response = requests.get(
-                f"{self.base_url}/api/dashboard/{dashboard_id}",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            current = response.json()
+            current = self._get_dashboard_layout(dashboard_id)
             
             # Build dashcards payload - use format expected by PUT /api/dashboard
-            cards_payload = []
-            for i, dc in enumerate(dashcards):
-                card_payload = {
-                    "id": -(i + 1),  # Negative IDs for new cards
-                    "card_id": dc['card_id'],
-                    "row": dc.get('row', 0),
-                    "col": dc.get('col', 0),
-                    "size_x": dc.get('size_x', 4),
-                    "size_y": dc.get('size_y', 4),
-                    "parameter_mappings": dc.get('parameter_mappings', []),
-                    # Only include click_behavior from visualization_settings
-                    # to preserve links without causing filter conflicts
-                    "visualization_settings": dc.get('visualization_settings', {}),
-                }
-                
-                # Add tab ID if present
-                if dc.get('dashboard_tab_id'):
-                    card_payload['dashboard_tab_id'] = dc['dashboard_tab_id']
-                
-                # Add series if present (for combined charts)
-                if dc.get('series'):
-                    card_payload['series'] = dc['series']
-                
-                cards_payload.append(card_payload)
+            cards_payload = [_new_dashcard_payload(i, dc) for i, dc in enumerate(dashcards)]
             
             # Update dashboard with dashcards - preserve existing tabs!
             update_payload = {
@@ -827,25 +1548,22 @@ class DashboardCloner:
             current_tabs = current.get('tabs', [])
             if current_tabs:
                 update_payload['tabs'] = current_tabs
-                logger.info(f"  Preserving {len(current_tabs)} tabs during card update")
+                logger.info("  Preserving %s tabs during card update", len(current_tabs))
             
-            logger.info(f"  Updating dashboard with {len(cards_payload)} cards...")
+            logger.info("  Updating dashboard with %s cards...", len(cards_payload))
             
-            response = requests.put(
-                f"{self.base_url}/api/dashboard/{dashboard_id}",
-                headers=self.headers,
-                json=update_payload
-            )
+            response = self._put_json(f"{self.base_url}/api/dashboard/{dashboard_id}", update_payload)
+            self._invalidate_load('dashboard', dashboard_id)
             response.raise_for_status()
             
-            logger.info(f"  + Added {len(cards_payload)} cards via dashboard update")
+            logger.info("  + Added %s cards via dashboard update", len(cards_payload))
             return True
         
         except Exception as e:
-            logger.error(f"  x Failed to add cards via dashboard update: {e}")
+            logger.error("  x Failed to add cards via dashboard update: %s", e)
             if hasattr(e, 'response') and e.response is not None:
                 try:
-                    logger.error(f"  Response: {e.response.text[:500]}")
+                    logger.error("  Response: %s", e.response.text[:500])
                 except:
                     pass
             return False
@@ -855,18 +1573,16 @@ class DashboardCloner:
         Update all dashcards on a dashboard using PUT /api/dashboard/{id}
         """
         try:
-            response = requests.put(
-                f"{self.base_url}/api/dashboard/{dashboard_id}",
-                headers=self.headers,
-                json={"dashcards": dashcards}
-            )
+            response = self._put_json(f"{self.base_url}/api/dashboard/{dashboard_id}", {"dashcards": dashcards})
+            self._invalidate_load('dashboard', dashboard_id)
             response.raise_for_status()
             return True
         except Exception as e:
-            logger.error(f"  x Failed to update dashcards: {e}")
+            logger.error("  x Failed to update dashcards: %s", e)
             return False
     
-    def update_dashboard_click_behaviors(self, dashboard_id: int, tab_mapping: dict = None) -> bool:
+    def update_dashboard_click_behaviors(self, dashboard_id: int, tab_mapping: dict = None,
+                                         dashboard: dict = None, remap: dict = None) -> bool:
         """
         Update click behaviors in a dashboard with the current mapping.
         Call this after all dashboards are cloned to fix cross-references.
@@ -876,57 +1592,64 @@ class DashboardCloner:
             tab_mapping: Optional mapping of old_tab_id -> new_tab_id for tab links
                         (Note: per-dashboard tab mappings in self.dashboard_tab_mappings
                         take precedence for cross-dashboard tab references)
+            dashboard: Optional already-loaded dashboard (e.g. from the previous PUT) to skip the GET
+            remap: Optional lookup tables from _click_remap_tables, shared across many dashboards
         """
         try:
-            # Get current dashboard
-            response = requests.get(
-                f"{self.base_url}/api/dashboard/{dashboard_id}",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            dashboard = response.json()
+            # Get current dashboard unless the caller already has it
+            if dashboard is None:
+                dashboard = self._get_dashboard_layout(dashboard_id)
             
             dashcards = dashboard.get('dashcards', []) or dashboard.get('ordered_cards', [])
             if not dashcards:
                 return True
             
+            if remap is None:
+                remap = self._click_remap_tables(tab_mapping)
+            
+            # Skip the walk and the PUT when no click behavior references anything we remap
+            if not self._click_behaviors_need_remap(dashcards, remap=remap):
+                logger.debug("    No remappable click behaviors in dashboard %s", dashboard_id)
+                return True
+            
             # Update each dashcard's click behaviors
             updated_dashcards = []
             changes_made = False
             
+            debug = logger.isEnabledFor(logging.DEBUG)
             for dc in dashcards:
                 viz_settings = dc.get('visualization_settings', {})
                 card_name = dc.get('card', {}).get('name', 'Unknown')
                 
                 if viz_settings:
-                    original = json.dumps(viz_settings, sort_keys=True)
-                    logger.debug(f"  Checking dashcard '{card_name}' viz_settings before remap")
-                    
-                    # Log click behaviors before remapping
-                    if 'click_behavior' in viz_settings:
-                        logger.info(f"    Before remap - click_behavior: targetId={viz_settings['click_behavior'].get('targetId')}, tabId={viz_settings['click_behavior'].get('tabId', 'NOT SET')}")
-                    if 'column_settings' in viz_settings:
-                        for col_key, col_settings in viz_settings['column_settings'].items():
+                    if debug:
+                        logger.debug("  Checking dashcard '%s' viz_settings before remap", card_name)
+                        
+                        # Log click behaviors before remapping
+                        if 'click_behavior' in viz_settings:
+                            cb = viz_settings['click_behavior']
+                            logger.debug("    Before remap - click_behavior: targetId=%s, tabId=%s", cb.get('targetId'), cb.get('tabId', 'NOT SET'))
+                        for col_key, col_settings in (viz_settings.get('column_settings') or {}).items():
                             if 'click_behavior' in col_settings:
                                 cb = col_settings['click_behavior']
-                                logger.info(f"    Before remap - column click_behavior: targetId={cb.get('targetId')}, tabId={cb.get('tabId', 'NOT SET')}")
+                                logger.debug("    Before remap - column click_behavior: targetId=%s, tabId=%s", cb.get('targetId'), cb.get('tabId', 'NOT SET'))
                     
-                    remapped = self.remap_click_behavior(viz_settings, tab_mapping)
+                    remapped, dc_changed = self.remap_click_behavior(viz_settings, remap=remap)
                     
-                    # Log click behaviors after remapping
-                    if 'click_behavior' in remapped:
-                        logger.info(f"    After remap - click_behavior: targetId={remapped['click_behavior'].get('targetId')}, tabId={remapped['click_behavior'].get('tabId', 'NOT SET')}")
-                    if 'column_settings' in remapped:
-                        for col_key, col_settings in remapped['column_settings'].items():
+                    if debug:
+                        # Log click behaviors after remapping
+                        if 'click_behavior' in remapped:
+                            cb = remapped['click_behavior']
+                            logger.debug("    After remap - click_behavior: targetId=%s, tabId=%s", cb.get('targetId'), cb.get('tabId', 'NOT SET'))
+                        for col_key, col_settings in (remapped.get('column_settings') or {}).items():
                             if 'click_behavior' in col_settings:
                                 cb = col_settings['click_behavior']
-                                logger.info(f"    After remap - column click_behavior: targetId={cb.get('targetId')}, tabId={cb.get('tabId', 'NOT SET')}")
+                                logger.debug("    After remap - column click_behavior: targetId=%s, tabId=%s", cb.get('targetId'), cb.get('tabId', 'NOT SET'))
                     
-                    remapped_str = json.dumps(remapped, sort_keys=True)
-                    if remapped_str != original:
+                    if dc_changed:
                         changes_made = True
-                        dc['visualization_settings'] = remapped
-                        logger.info(f"    Changes detected for '{card_name}'")
+                        viz_settings = remapped  # don't write back into the (possibly cached) dashcard
+                        logger.info("    Changes detected for '%s'", card_name)
                 
                 dashcard_update = {
                     'id': dc['id'],
@@ -936,7 +1659,7 @@ class DashboardCloner:
                     'size_x': dc.get('size_x', 4),
                     'size_y': dc.get('size_y', 4),
                     'parameter_mappings': dc.get('parameter_mappings', []),
-                    'visualization_settings': dc.get('visualization_settings', {}),
+                    'visualization_settings': viz_settings,
                     'series': dc.get('series', [])
                 }
                 # Preserve tab assignment
@@ -945,7 +1668,7 @@ class DashboardCloner:
                 updated_dashcards.append(dashcard_update)
             
             if not changes_made:
-                logger.debug(f"    No click behavior changes needed for dashboard {dashboard_id}")
+                logger.debug("    No click behavior changes needed for dashboard %s", dashboard_id)
                 return True
             
             # Update dashboard with fixed click behaviors - preserve tabs!
@@ -954,117 +1677,129 @@ class DashboardCloner:
             if current_tabs:
                 update_payload['tabs'] = current_tabs
             
-            response = requests.put(
-                f"{self.base_url}/api/dashboard/{dashboard_id}",
-                headers=self.headers,
-                json=update_payload
-            )
+            response = self._put_json(f"{self.base_url}/api/dashboard/{dashboard_id}", update_payload)
+            self._invalidate_load('dashboard', dashboard_id)
             response.raise_for_status()
             return True
             
         except Exception as e:
-            logger.error(f"  Failed to update click behaviors: {e}")
+            logger.error("  Failed to update click behaviors: %s", e)
             return False
     
-    def analyze_dashboard_links(self, dashboard_id: int) -> set:
-        """Find all dashboards that this dashboard links to"""
-        linked_dashboards = set()
+    def _click_behaviors_need_remap(self, dashcards: List[dict], tab_mapping: dict = None,
+                                    remap: dict = None) -> bool:
+        """
+        Pre-scan: True if any click behavior references an id present in the current
+        mappings (or carries a parameterMapping, whose field ids may need remapping).
+        """
+        referenced_dashboards = set()
+        referenced_questions = set()
+        has_tab_ids = False
+        for dc in dashcards:
+            for cb in _iter_click_behaviors(dc):
+                if cb.get('parameterMapping'):
+                    return True
+                link_type = cb.get('linkType')
+                if link_type == 'dashboard':
+                    referenced_dashboards.add(cb.get('targetId'))
+                    has_tab_ids = has_tab_ids or 'tabId' in cb
+                elif link_type == 'question':
+                    referenced_questions.add(cb.get('targetId'))
+        
+        if remap is None:
+            remap = self._click_remap_tables(tab_mapping)
+        if not referenced_dashboards.isdisjoint(remap['dashboards'].keys()):
+            return True
+        if not referenced_questions.isdisjoint(remap['questions'].keys()):
+            return True
+        # Tab ids are resolved against the target dashboard's mapping (or the fallback one)
+        return has_tab_ids and bool(remap['tabs'] or remap['per_dash_tabs'])
+    
+    def analyze_dashboard_links(self, dashboard_id: int) -> frozenset:
+        """Find all dashboards that this dashboard links to (cached per clone operation)"""
+        cached = self._links_cache.get(dashboard_id)
+        if cached is not None:
+            return cached
         
-        dashboard = self.manager.get_dashboard(dashboard_id)
+        dashboard = self._get_dashboard(dashboard_id)
         if not dashboard:
-            return linked_dashboards
+            return frozenset()
         
         # Note: Metabase API may return 'dashcards' or 'ordered_cards'
         dashcards = dashboard.get('dashcards', []) or dashboard.get('ordered_cards', [])
-        for dashcard in dashcards:
-            viz_settings = dashcard.get('visualization_settings', {})
-            
-            # Check click_behavior
-            if 'click_behavior' in viz_settings:
-                cb = viz_settings['click_behavior']
-                if cb.get('linkType') == 'dashboard' and cb.get('targetId'):
-                    linked_dashboards.add(cb['targetId'])
-            
-            # Check column settings
-            if 'column_settings' in viz_settings:
-                for col_settings in viz_settings['column_settings'].values():
-                    if 'click_behavior' in col_settings:
-                        cb = col_settings['click_behavior']
-                        if cb.get('linkType') == 'dashboard' and cb.get('targetId'):
-                            linked_dashboards.add(cb['targetId'])
-            
-            # Also check the card's visualization settings
-            card_info = dashcard.get('card', {})
-            card_viz = card_info.get('visualization_settings', {})
-            if 'click_behavior' in card_viz:
-                cb = card_viz['click_behavior']
-                if cb.get('linkType') == 'dashboard' and cb.get('targetId'):
-                    linked_dashboards.add(cb['targetId'])
-        
+        linked_dashboards = frozenset(
+            cb['targetId']
+            for dc in dashcards
+            for cb in _iter_click_behaviors(dc)
+            if cb.get('linkType') == 'dashboard' and cb.get('targetId')
+        )
+        self._links_cache[dashboard_id] = linked_dashboards
         return linked_dashboards
     
-    def diagnose_click_behaviors(self, dashboard_id: int):
+    def diagnose_click_behaviors(self, dashboard_id: int, dashboard: dict = None):
         """
         Diagnostic function to print all click behaviors in a dashboard.
         Use this to debug tab navigation issues.
+        Pass `dashboard` when it is already loaded to skip the fetch.
         """
-        dashboard = self.manager.get_dashboard(dashboard_id)
+        if dashboard is None:
+            dashboard = self._get_dashboard(dashboard_id)
         if not dashboard:
-            logger.error(f"Dashboard {dashboard_id} not found")
+            logger.error("Dashboard %s not found", dashboard_id)
             return
         
-        logger.info(f"\n{'='*60}")
-        logger.info(f"CLICK BEHAVIOR DIAGNOSIS FOR DASHBOARD {dashboard_id}")
-        logger.info(f"Dashboard name: {dashboard.get('name')}")
-        logger.info(f"{'='*60}")
+        logger.info("\n" + "="*60)
+        logger.info("CLICK BEHAVIOR DIAGNOSIS FOR DASHBOARD %s", dashboard_id)
+        logger.info("Dashboard name: %s", dashboard.get('name'))
+        logger.info("="*60)
         
         # Show tabs
         tabs = dashboard.get('tabs', [])
         if tabs:
-            logger.info(f"\nTabs ({len(tabs)}):")
+            logger.info("\nTabs (%s):", len(tabs))
             for tab in tabs:
-                logger.info(f"  - ID: {tab.get('id')}, Name: {tab.get('name')}")
+                logger.info("  - ID: %s, Name: %s", tab.get('id'), tab.get('name'))
         else:
             logger.info("\nNo tabs in this dashboard")
         
         # Show click behaviors
         dashcards = dashboard.get('dashcards', []) or dashboard.get('ordered_cards', [])
-        logger.info(f"\nDashcards ({len(dashcards)}):")
+        logger.info("\nDashcards (%s):", len(dashcards))
         
         for i, dashcard in enumerate(dashcards):
             card_info = dashcard.get('card', {})
             card_name = card_info.get('name', 'Unknown')
             dashcard_tab = dashcard.get('dashboard_tab_id')
             
-            logger.info(f"\n  [{i+1}] Card: {card_name}")
-            logger.info(f"      Dashcard ID: {dashcard.get('id')}")
-            logger.info(f"      On Tab ID: {dashcard_tab}")
+            logger.info("\n  [%s] Card: %s", i + 1, card_name)
+            logger.info("      Dashcard ID: %s", dashcard.get('id'))
+            logger.info("      On Tab ID: %s", dashcard_tab)
             
             viz_settings = dashcard.get('visualization_settings', {})
             
             # Top-level click behavior
             if 'click_behavior' in viz_settings:
                 cb = viz_settings['click_behavior']
-                logger.info(f"      Top-level click_behavior:")
-                logger.info(f"        linkType: {cb.get('linkType')}")
-                logger.info(f"        targetId: {cb.get('targetId')}")
-                logger.info(f"        tabId: {cb.get('tabId', 'NOT SET')}")
+                logger.info("      Top-level click_behavior:")
+                logger.info("        linkType: %s", cb.get('linkType'))
+                logger.info("        targetId: %s", cb.get('targetId'))
+                logger.info("        tabId: %s", cb.get('tabId', 'NOT SET'))
                 if 'parameterMapping' in cb:
-                    logger.info(f"        parameterMapping: {list(cb['parameterMapping'].keys())}")
+                    logger.info("        parameterMapping: %s", list(cb['parameterMapping'].keys()))
             
             # Column settings click behaviors
             if 'column_settings' in viz_settings:
                 for col_key, col_settings in viz_settings['column_settings'].items():
                     if 'click_behavior' in col_settings:
                         cb = col_settings['click_behavior']
-                        logger.info(f"      Column click_behavior [{col_key[:30]}...]:")
-                        logger.info(f"        linkType: {cb.get('linkType')}")
-                        logger.info(f"        targetId: {cb.get('targetId')}")
-                        logger.info(f"        tabId: {cb.get('tabId', 'NOT SET')}")
+                        logger.info("      Column click_behavior [%s...]:", col_key[:30])
+                        logger.info("        linkType: %s", cb.get('linkType'))
+                        logger.info("        targetId: %s", cb.get('targetId'))
+                        logger.info("        tabId: %s", cb.get('tabId', 'NOT SET'))
                         if 'parameterMapping' in cb:
-                            logger.info(f"        parameterMapping: {list(cb['parameterMapping'].keys())}")
+                            logger.info("        parameterMapping: %s", list(cb['parameterMapping'].keys()))
         
-        logger.info(f"\n{'='*60}\n")
+        logger.info("\n" + "="*60 + "\n")
     
     def clone_dashboard(self, source_dashboard_id: int, new_name: str,
                        new_database_id: int, dashboard_collection_id: int = None,
@@ -1084,17 +1819,22 @@ class DashboardCloner:
         # Check if stop requested
         self.check_stop_requested()
         
+        # New dashboard_load_id so Metabase memoizes only within this dashboard's request burst
+        # (per thread - linked dashboards may be cloned concurrently)
+        self._local.load_id = _uuid4().hex
+        
         # Store dashboard link mappings
         if dashboard_links_mapping:
-            self.dashboard_mapping.update(dashboard_links_mapping)
+            with self._lock:
+                self.dashboard_mapping.update(dashboard_links_mapping)
         
         # Get source dashboard
-        logger.info(f"Getting source dashboard {source_dashboard_id}...")
-        source = self.manager.get_dashboard(source_dashboard_id)
+        logger.info("Getting source dashboard %s...", source_dashboard_id)
+        source = self._get_dashboard(source_dashboard_id)
         if not source:
             raise Exception(f"Dashboard {source_dashboard_id} not found")
         
-        logger.info(f"Source dashboard: {source.get('name')}")
+        logger.info("Source dashboard: %s", source.get('name'))
         
         # Find source database from questions
         # Note: Metabase API may return 'dashcards' or 'ordered_cards'
@@ -1112,27 +1852,27 @@ class DashboardCloner:
         if source_db_id:
             # Only rebuild mapping if not already built or if it's a different source DB
             if not self.field_mapping or not self.table_mapping:
-                logger.info(f"Source database ID: {source_db_id}, Target database ID: {new_database_id}")
+                logger.info("Source database ID: %s, Target database ID: %s", source_db_id, new_database_id)
                 self.build_table_field_mapping(source_db_id, new_database_id)
             else:
-                logger.info(f"Using existing field mapping ({len(self.field_mapping)} fields, {len(self.table_mapping)} tables)")
+                logger.info("Using existing field mapping (%s fields, %s tables)", len(self.field_mapping), len(self.table_mapping))
         else:
             if self.field_mapping:
-                logger.info(f"No database found in cards - using existing field mapping ({len(self.field_mapping)} fields)")
+                logger.info("No database found in cards - using existing field mapping (%s fields)", len(self.field_mapping))
             else:
                 logger.warning("Could not determine source database - will try without field mapping")
         
         # Analyze linked dashboards
         linked_dashboards = self.analyze_dashboard_links(source_dashboard_id)
         if linked_dashboards:
-            logger.info(f"Dashboard links to: {linked_dashboards}")
-            unmapped = linked_dashboards - set(self.dashboard_mapping.keys())
+            logger.info("Dashboard links to: %s", linked_dashboards)
+            unmapped = linked_dashboards - self.dashboard_mapping.keys()
             if unmapped:
-                logger.warning(f"Warning: No mapping for linked dashboards: {unmapped}")
+                logger.warning("Warning: No mapping for linked dashboards: %s", unmapped)
                 logger.warning("Click behaviors to these dashboards will keep original IDs")
         
         # Create new dashboard
-        logger.info(f"Creating new dashboard: {new_name}...")
+        logger.info("Creating new dashboard: %s...", new_name)
         new_dashboard = self.manager.create_dashboard(
             name=new_name,
             description=source.get('description', ''),
@@ -1141,17 +1881,18 @@ class DashboardCloner:
         if not new_dashboard:
             raise Exception("Failed to create dashboard")
         
-        logger.info(f"Created dashboard ID: {new_dashboard['id']}")
+        logger.info("Created dashboard ID: %s", new_dashboard['id'])
         
         # IMPORTANT: Store the dashboard mapping NOW so self-references can be remapped
         # This allows click behaviors that link to the same dashboard to be properly updated
-        self.dashboard_mapping[source_dashboard_id] = new_dashboard['id']
+        with self._lock:
+            self.dashboard_mapping[source_dashboard_id] = new_dashboard['id']
         
         # Store dashboard parameters (filters) - will be remapped AFTER questions are cloned
         # because filter dropdowns may reference questions for their values
         dashboard_params = source.get('parameters', [])
         if dashboard_params:
-            logger.info(f"Found {len(dashboard_params)} dashboard filters")
+            logger.info("Found %s dashboard filters", len(dashboard_params))
             
             # IMPORTANT: Clone filter-linked questions FIRST
             # These are "hidden" questions that provide dropdown values but aren't on the dashboard
@@ -1167,7 +1908,7 @@ class DashboardCloner:
         source_tabs = source.get('tabs', [])
         new_tabs_for_update = []
         if source_tabs:
-            logger.info(f"Dashboard has {len(source_tabs)} tabs - will create with cards")
+            logger.info("Dashboard has %s tabs - will create with cards", len(source_tabs))
             # Prepare tabs with negative IDs
             for i, tab in enumerate(source_tabs):
                 new_tab = {
@@ -1180,132 +1921,140 @@ class DashboardCloner:
                 tab_mapping[tab['id']] = -(i + 1)
         
         # Phase 1: Clone all questions first (to build question_mapping)
-        logger.info(f"\n--- Cloning {len(ordered_cards)} cards ---")
+        logger.info("\n--- Cloning %s cards ---", len(ordered_cards))
         
         cloned_count = 0
         skipped_count = 0
         failed_count = 0
         
+        # Collect unique questions still to clone, preserving dashboard order
+        pending = {}  # original_id -> card embedded in the dashboard payload
         for dashcard in ordered_cards:
             card_info = dashcard.get('card', {})
             original_id = card_info.get('id')
             
             if not original_id:
                 # This might be a text card or virtual card
-                logger.info(f"  Skipping card without ID (text/virtual card)")
+                logger.info("  Skipping card without ID (text/virtual card)")
                 skipped_count += 1
                 continue
             
             if original_id in self.question_mapping:
-                logger.info(f"  Reusing already cloned question {original_id} -> {self.question_mapping[original_id]}")
+                logger.info("  Reusing already cloned question %s -> %s", original_id, self.question_mapping[original_id])
                 continue  # Already cloned
             
+            if original_id not in pending:
+                pending[original_id] = card_info
+        
+        def clone_one(original_id):
+            card_info = pending[original_id]
             original_name = card_info.get('name', f'Question {original_id}')
-            logger.info(f"  Cloning question {original_id}: {original_name}")
-            
-            # Clone the question
-            cloned = self.clone_question(
+            logger.info("  Cloning question %s: %s", original_id, original_name)
+            # The dashboard already embeds the full card - skip the per-card GET when it does
+            original = card_info
+            if 'dataset_query' not in card_info:
+                original = self._load_get('card', original_id)
+            return original_id, self._clone_question_once(
                 question_id=original_id,
                 new_name=original_name,
                 new_database_id=new_database_id,
-                collection_id=questions_collection_id
+                collection_id=questions_collection_id,
+                original=original
             )
-            
-            if cloned:
-                self.question_mapping[original_id] = cloned['id']
-                cloned_count += 1
-            else:
-                logger.error(f"  FAILED to clone question {original_id}: {original_name}")
-                failed_count += 1
         
-        logger.info(f"\nQuestion cloning summary: {cloned_count} cloned, {skipped_count} skipped (text cards), {failed_count} failed")
-        logger.info(f"Total questions in mapping: {len(self.question_mapping)}")
+        # Clones are independent round-trips - overlap them with a small pool
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(self.clone_workers, len(pending))) as executor:
+                futures = [_submit(executor, clone_one, qid) for qid in pending]
+                for future in as_completed(futures):
+                    original_id, cloned = future.result()
+                    if cloned:
+                        cloned_count += 1
+                    else:
+                        logger.error("  FAILED to clone question %s: %s", original_id, pending[original_id].get('name', 'Unknown'))
+                        failed_count += 1
+        
+        logger.info("\nQuestion cloning summary: %s cloned, %s skipped (text cards), %s failed", cloned_count, skipped_count, failed_count)
+        logger.info("Total questions in mapping: %s", len(self.question_mapping))
         
-        # Now remap and apply dashboard parameters (filters)
+        # Now remap dashboard parameters (filters) - sent with the dashcards PUT below
         # This must happen AFTER questions are cloned so we can remap card references
-        if dashboard_params:
-            remapped_params = self.remap_dashboard_parameters(dashboard_params)
-            self.manager.update_dashboard(new_dashboard['id'], {'parameters': remapped_params})
-            logger.info(f"Applied {len(remapped_params)} remapped dashboard filters")
+        remapped_params = self.remap_dashboard_parameters(dashboard_params) if dashboard_params else None
         
         # Phase 2: Prepare all cards for batch add
-        logger.info(f"\n--- Preparing cards for dashboard ---")
+        logger.info("\n--- Preparing cards for dashboard ---")
         dashcards_to_add = []
         
+        qm = self.question_mapping
+        debug = logger.isEnabledFor(logging.DEBUG)
         for dashcard in ordered_cards:
-            card_info = dashcard.get('card', {})
+            g = dashcard.get
+            card_info = g('card') or {}
             original_id = card_info.get('id')
+            viz_settings = g('visualization_settings') or {}
+            
+            # Map tab ID if on a tab (keep original if no mapping - shouldn't happen)
+            old_tab_id = g('dashboard_tab_id')
+            new_tab_id = tab_mapping.get(old_tab_id, old_tab_id) if old_tab_id else None
             
             # Handle text/virtual cards (no card_id)
             if not original_id:
                 # Text cards don't have a card_id - just copy their layout and settings
-                viz_settings = dashcard.get('visualization_settings', {})
-                
                 text_card_data = {
                     'card_id': None,  # Text cards have null card_id
-                    'row': dashcard.get('row', 0),
-                    'col': dashcard.get('col', 0),
-                    'size_x': dashcard.get('size_x', 4),
-                    'size_y': dashcard.get('size_y', 2),
+                    'row': g('row', 0),
+                    'col': g('col', 0),
+                    'size_x': g('size_x', 4),
+                    'size_y': g('size_y', 2),
                     'parameter_mappings': [],
-                    'visualization_settings': viz_settings,  # Contains the text content
+                    'visualization_settings': self._intern_viz(viz_settings),  # Contains the text content
                     'series': []
                 }
-                
-                # Map tab ID if on a tab
-                old_tab_id = dashcard.get('dashboard_tab_id')
-                if old_tab_id and old_tab_id in tab_mapping:
-                    text_card_data['dashboard_tab_id'] = tab_mapping[old_tab_id]
-                elif old_tab_id:
-                    text_card_data['dashboard_tab_id'] = old_tab_id
+                if new_tab_id:
+                    text_card_data['dashboard_tab_id'] = new_tab_id
                 
                 dashcards_to_add.append(text_card_data)
-                logger.info(f"  Prepared text/virtual card")
+                logger.info("  Prepared text/virtual card")
                 continue
             
-            new_card_id = self.question_mapping.get(original_id)
+            new_card_id = qm.get(original_id)
             if not new_card_id:
-                logger.error(f"  SKIPPING card {original_id} ({card_info.get('name', 'Unknown')}) - no cloned version found!")
-                logger.error(f"    This question may have failed to clone. Check logs above for errors.")
+                logger.error("  SKIPPING card %s (%s) - no cloned version found!", original_id, card_info.get('name', 'Unknown'))
+                logger.error("    This question may have failed to clone. Check logs above for errors.")
                 continue
             
             # Remap parameter mappings
-            param_mappings = dashcard.get('parameter_mappings', [])
+            param_mappings = g('parameter_mappings')
             if param_mappings:
                 param_mappings = self.remap_parameter_mappings(param_mappings, new_card_id)
             
             # Remap visualization settings (click behavior)
-            viz_settings = dashcard.get('visualization_settings', {})
             if viz_settings:
                 # Log original click behaviors for debugging
-                if 'click_behavior' in viz_settings:
-                    logger.info(f"  Original click_behavior: {json.dumps(viz_settings['click_behavior'], indent=2)}")
-                if 'column_settings' in viz_settings:
-                    for col_key, col_settings in viz_settings['column_settings'].items():
+                if debug:
+                    if 'click_behavior' in viz_settings:
+                        logger.debug("  Original click_behavior: %s", json.dumps(viz_settings['click_behavior'], indent=2))
+                    for col_key, col_settings in (viz_settings.get('column_settings') or {}).items():
                         if 'click_behavior' in col_settings:
-                            logger.info(f"  Original column click_behavior [{col_key}]: {json.dumps(col_settings['click_behavior'], indent=2)}")
-                viz_settings = self.remap_click_behavior(viz_settings)
+                            logger.debug("  Original column click_behavior [%s]: %s", col_key, json.dumps(col_settings['click_behavior'], indent=2))
+                viz_settings, _ = self.remap_click_behavior(viz_settings)
             
             # Remap series (for combined charts)
             # Series can be a list of card IDs or card objects
-            series = dashcard.get('series', [])
             remapped_series = []
-            if series:
-                for s in series:
-                    if isinstance(s, dict):
-                        old_id = s.get('id')
-                        if old_id in self.question_mapping:
-                            # Keep the full object structure, just update the ID
-                            new_series_item = json.loads(json.dumps(s))
-                            new_series_item['id'] = self.question_mapping[old_id]
-                            remapped_series.append(new_series_item)
-                        else:
-                            logger.warning(f"  Could not remap series card {old_id}")
-                    elif isinstance(s, int):
-                        if s in self.question_mapping:
-                            remapped_series.append(self.question_mapping[s])
-                        else:
-                            logger.warning(f"  Could not remap series card {s}")
+            for s in g('series') or ():
+                if isinstance(s, dict):
+                    old_id = s.get('id')
+                    if old_id in qm:
+                        # Keep the full object structure, just update the ID (nested values are not mutated)
+                        remapped_series.append({**s, 'id': qm[old_id]})
+                    else:
+                        logger.warning("  Could not remap series card %s", old_id)
+                elif isinstance(s, int):
+                    if s in qm:
+                        remapped_series.append(qm[s])
+                    else:
+                        logger.warning("  Could not remap series card %s", s)
             
             # Prepare card data
             # Keep click_behavior (top-level and in column_settings) to preserve links
@@ -1317,113 +2066,253 @@ class DashboardCloner:
                     clean_viz_settings['click_behavior'] = viz_settings['click_behavior']
                 
                 # Column-level click behaviors (very common for tables/charts)
-                if 'column_settings' in viz_settings:
-                    clean_column_settings = {}
-                    for col_key, col_settings in viz_settings['column_settings'].items():
-                        if 'click_behavior' in col_settings:
-                            clean_column_settings[col_key] = {'click_behavior': col_settings['click_behavior']}
+                column_settings = viz_settings.get('column_settings')
+                if column_settings:
+                    clean_column_settings = {
+                        col_key: {'click_behavior': col_settings['click_behavior']}
+                        for col_key, col_settings in column_settings.items()
+                        if 'click_behavior' in col_settings
+                    }
                     if clean_column_settings:
                         clean_viz_settings['column_settings'] = clean_column_settings
             
             dashcard_data = {
                 'card_id': new_card_id,
-                'row': dashcard.get('row', 0),
-                'col': dashcard.get('col', 0),
-                'size_x': dashcard.get('size_x', 4),
-                'size_y': dashcard.get('size_y', 4),
-                'parameter_mappings': param_mappings if param_mappings else [],
-                'visualization_settings': clean_viz_settings,
-                'series': remapped_series if remapped_series else []
+                'row': g('row', 0),
+                'col': g('col', 0),
+                'size_x': g('size_x', 4),
+                'size_y': g('size_y', 4),
+                'parameter_mappings': param_mappings or [],
+                'visualization_settings': self._intern_viz(clean_viz_settings),
+                'series': remapped_series
             }
-            
-            # Map tab ID if dashcard is on a tab
-            old_tab_id = dashcard.get('dashboard_tab_id')
-            if old_tab_id and old_tab_id in tab_mapping:
-                dashcard_data['dashboard_tab_id'] = tab_mapping[old_tab_id]
-            elif old_tab_id:
-                # Keep original if no mapping (shouldn't happen)
-                dashcard_data['dashboard_tab_id'] = old_tab_id
+            if new_tab_id:
+                dashcard_data['dashboard_tab_id'] = new_tab_id
             
             dashcards_to_add.append(dashcard_data)
-            logger.info(f"  Prepared card: {card_info.get('name', 'Unknown')}")
+            logger.info("  Prepared card: %s", card_info.get('name', 'Unknown'))
         
         # Add all cards via dashboard update (works on all Metabase versions)
         # Include tabs in the same request to create them atomically
-        logger.info(f"\n--- Adding {len(dashcards_to_add)} cards to dashboard ---")
+        logger.info("\n--- Adding %s cards to dashboard ---", len(dashcards_to_add))
+        updated = None
+        params_applied = False
         if dashcards_to_add or new_tabs_for_update:
-            success, actual_tab_mapping = self.add_dashcards_with_tabs(
+            success, actual_tab_mapping, updated_dash, params_applied = self.add_dashcards_with_tabs(
                 new_dashboard['id'], 
                 dashcards_to_add, 
                 new_tabs_for_update,
-                source_tabs
+                source_tabs,
+                parameters=remapped_params
             )
             
             # Update tab_mapping with actual IDs
             if actual_tab_mapping:
                 tab_mapping = actual_tab_mapping
-                # Store tab mapping for use in click behavior updates
-                self.tab_mapping = actual_tab_mapping
-                # Also store per-dashboard tab mapping for cross-dashboard tab references
-                self.dashboard_tab_mappings[new_dashboard['id']] = actual_tab_mapping
-                logger.info(f"  Stored tab mapping for dashboard {new_dashboard['id']}: {actual_tab_mapping}")
+                with self._lock:
+                    # Store per-dashboard tab mapping for click behavior updates and
+                    # cross-dashboard tab references (dashboards may be cloned concurrently)
+                    self.dashboard_tab_mappings[new_dashboard['id']] = actual_tab_mapping
+                logger.info("  Stored tab mapping for dashboard %s: %s", new_dashboard['id'], actual_tab_mapping)
             
             if not success:
                 logger.error("  Failed to add cards to dashboard!")
             else:
-                # Verify cards were added
-                updated = self.manager.get_dashboard(new_dashboard['id'])
+                # Verify cards were added - the PUT response already holds the dashcards
+                if updated_dash and ('dashcards' in updated_dash or 'ordered_cards' in updated_dash):
+                    updated = updated_dash
+                else:
+                    updated = self._get_dashboard(new_dashboard['id'])
                 if updated:
                     final_cards = updated.get('dashcards', []) or updated.get('ordered_cards', [])
                     final_tabs = updated.get('tabs', [])
-                    logger.info(f"  Verified: Dashboard has {len(final_cards)} cards, {len(final_tabs)} tabs")
+                    logger.info("  Verified: Dashboard has %s cards, %s tabs", len(final_cards), len(final_tabs))
+        
+        # Apply filters on their own if they couldn't ride along with the dashcards PUT
+        if remapped_params and not params_applied:
+            params_applied = self.manager.update_dashboard(new_dashboard['id'], {'parameters': remapped_params})
+            self._invalidate_load('dashboard', new_dashboard['id'])
+        if remapped_params:
+            if params_applied:
+                logger.info("Applied %s remapped dashboard filters", len(remapped_params))
+            else:
+                logger.error("Failed to apply %s remapped dashboard filters to dashboard %s - it has no filters",
+                             len(remapped_params), new_dashboard['id'])
         
         # Phase 3: Update click behaviors with actual tab IDs
         # This is needed because click behaviors may reference tabs on the target dashboard
-        # and we now have the real tab IDs after creation
-        if tab_mapping:
-            logger.info(f"\n--- Updating click behaviors with tab mappings ---")
-            logger.info(f"  tab_mapping: {tab_mapping}")
-            logger.info(f"  dashboard_tab_mappings: {self.dashboard_tab_mappings}")
-            logger.info(f"  dashboard_mapping: {self.dashboard_mapping}")
-            self.update_dashboard_click_behaviors(new_dashboard['id'], tab_mapping)
-        
-        logger.info(f"\n=== Dashboard cloned successfully! ===")
+        # and we now have the real tab IDs after creation. Metabase doesn't resolve the
+        # negative tab IDs inside visualization settings, so this can't ride on the first
+        # PUT - but it's only needed when some click behavior actually targets a tab.
+        link_behaviors = [
+            cb for dc in dashcards_to_add for cb in _iter_click_behaviors(dc)
+            if cb.get('linkType') in ('dashboard', 'question')
+        ]
+        has_tab_links = any('tabId' in cb for cb in link_behaviors)
+        
+        # Only dashboards with links need revisiting once all dashboards are cloned
+        if link_behaviors:
+            with self._lock:
+                self._dashboards_with_click_behaviors.add(new_dashboard['id'])
+        if tab_mapping and has_tab_links:
+            logger.info("\n--- Updating click behaviors with tab mappings ---")
+            logger.info("  tab_mapping: %s", tab_mapping)
+            logger.info("  dashboard_tab_mappings: %s", self.dashboard_tab_mappings)
+            logger.info("  dashboard_mapping: %s", self.dashboard_mapping)
+            self.update_dashboard_click_behaviors(new_dashboard['id'], tab_mapping, dashboard=updated)
+        
+        logger.info("\n=== Dashboard cloned successfully! ===")
         
         return new_dashboard
     
-    def find_all_linked_dashboards(self, dashboard_id: int, visited: set = None) -> List[int]:
+    def _bulk_get_dashboard_names(self, dashboard_ids: List[int]) -> Dict[int, str]:
+        """
+        Get {id: name} for several dashboards. Names come from the load cache when the
+        traversal just fetched them; the rest are fetched concurrently.
+        """
+        names = {}
+        missing = []
+        now = time.monotonic()
+        for dash_id in dashboard_ids:
+            entry = self._load_cache.get(('dashboard', dash_id))
+            if entry is not None and now - entry[0] < LOAD_CACHE_TTL_SECONDS:
+                names[dash_id] = entry[1].get('name', f'Dashboard {dash_id}')
+            else:
+                missing.append(dash_id)
+        
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(self.clone_workers, len(missing))) as executor:
+                for dash_id, dash in zip(missing, executor.map(self._get_dashboard, missing)):
+                    if dash:
+                        names[dash_id] = dash.get('name', f'Dashboard {dash_id}')
+        return names
+    
+    def _dashboard_levels(self, linked_ids: List[int]) -> List[List[int]]:
+        """
+        Group deepest-first linked dashboards into levels that can be cloned concurrently.
+        A dashboard's level is one more than the highest level it links to (links back
+        into a cycle are ignored), so everything it links to is cloned in an earlier level.
         """
-        Find ALL dashboards linked from this dashboard (recursively).
+        height = {}
+        for dash_id in linked_ids:  # Post-order: link targets come first
+            child_heights = [height[c] for c in self.analyze_dashboard_links(dash_id) if c in height]
+            height[dash_id] = 1 + max(child_heights) if child_heights else 0
+        
+        levels = [[] for _ in range(max(height.values()) + 1)] if height else []
+        for dash_id in linked_ids:
+            levels[height[dash_id]].append(dash_id)
+        return levels
+    
+    def find_all_linked_dashboards(self, dashboard_id: int, visited: set = None,
+                                   max_depth: Optional[int] = None) -> List[int]:
+        """
+        Find ALL dashboards linked from this dashboard (transitively).
         Returns them in order suitable for cloning (deepest first).
+        With max_depth, only dashboards within that many links of the source are included.
+        Always re-reads the link graph - links memoized by an earlier run may be stale.
+        """
+        self.invalidate_links_cache()
+        return list(self.iter_linked_dashboards(dashboard_id, visited, max_depth))
+    
+    def iter_linked_dashboards(self, dashboard_id: int, visited: set = None,
+                               max_depth: Optional[int] = None) -> Iterator[int]:
+        """
+        Yield the dashboards linked from this dashboard (transitively) as the traversal
+        finishes each one - deepest first, excluding dashboard_id itself.
         """
         if visited is None:
             visited = set()
         
         if dashboard_id in visited:
-            return []
+            return
+        
+        # Shortest link distance of every dashboard within max_depth (BFS), so a dashboard
+        # first reached down a long path isn't pruned when a shorter path exists
+        depth = None
+        if max_depth is not None:
+            depth = {dashboard_id: 0}
+            frontier = [dashboard_id]
+            for level in range(1, max_depth + 1):
+                next_frontier = []
+                for node in frontier:
+                    for child in self.analyze_dashboard_links(node):
+                        if child not in depth:
+                            depth[child] = level
+                            next_frontier.append(child)
+                frontier = next_frontier
+        
+        def links(node):
+            if depth is None:
+                return iter(self.analyze_dashboard_links(node))
+            if depth[node] >= max_depth:
+                return iter(())
+            return (c for c in self.analyze_dashboard_links(node) if c in depth)
         
         visited.add(dashboard_id)
-        result = []
         
-        # Get direct links from this dashboard
-        direct_links = self.analyze_dashboard_links(dashboard_id)
+        # Iterative DFS - post-order emission gives deepest-first without recursion limits
+        stack = [(dashboard_id, links(dashboard_id))]
+        while stack:
+            node, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                if stack:  # Root is emitted last - exclude it
+                    yield node
+            elif child not in visited:
+                visited.add(child)
+                stack.append((child, links(child)))
+    
+    def _stream_linked_dashboards(self, dashboard_id: int, max_depth: Optional[int] = None,
+                                  maxsize: int = 4) -> Iterator[int]:
+        """
+        Run iter_linked_dashboards on a producer thread and hand its ids over through a
+        bounded queue, so the caller can clone while discovery keeps fetching dashboards.
+        """
+        q = queue.Queue(maxsize=maxsize)
+        done = object()
+        abandoned = threading.Event()  # consumer stopped early - let the producer exit
+        
+        def put(item) -> bool:
+            while not abandoned.is_set():
+                try:
+                    q.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
         
-        # Recursively find links from each linked dashboard
-        for linked_id in direct_links:
-            if linked_id not in visited:
-                # Get nested links first (depth-first)
-                nested = self.find_all_linked_dashboards(linked_id, visited)
-                result.extend(nested)
-                # Then add this linked dashboard
-                if linked_id not in result:
-                    result.append(linked_id)
+        def produce():
+            try:
+                for dash_id in self.iter_linked_dashboards(dashboard_id, max_depth=max_depth):
+                    if not put(dash_id):
+                        return
+                put(done)
+            except Exception as e:
+                put(e)
         
-        return result
+        producer = threading.Thread(target=contextvars.copy_context().run, args=(produce,),
+                                    name=f"link-discovery-{dashboard_id}", daemon=True)
+        producer.start()
+        try:
+            while True:
+                item = q.get()
+                if item is done:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            abandoned.set()
     
     def clone_with_all_linked(self, source_dashboard_id: int, new_name: str,
                               new_database_id: int, dashboard_collection_id: int = None,
                               questions_collection_id: int = None,
-                              main_dashboard_collection_id: int = None) -> dict:
+                              main_dashboard_collection_id: int = None,
+                              max_depth: Optional[int] = None,
+                              precomputed_linked: Optional[List[int]] = None,
+                              checkpoint_dir: Optional[str] = None,
+                              resume: bool = False) -> dict:
         """
         Clone a dashboard AND all its linked dashboards with the new database.
         
@@ -1435,6 +2324,13 @@ class DashboardCloner:
         Args:
             main_dashboard_collection_id: If provided, the MAIN dashboard goes here,
                                          linked dashboards go to dashboard_collection_id
+            max_depth: If provided, only clone dashboards within this many links of the source
+            precomputed_linked: Result of find_all_linked_dashboards(source_dashboard_id) if the
+                                caller already has it - skips walking the link graph again
+            checkpoint_dir: If provided, the id mappings are checkpointed there after every
+                            dashboard so an interrupted run can be resumed
+            resume: Continue from the checkpoint in checkpoint_dir left by an interrupted run
+                    of the same clone (ids that no longer exist are cloned again)
         
         Returns the main cloned dashboard.
         """
@@ -1442,18 +2338,38 @@ class DashboardCloner:
         logger.info("CLONING DASHBOARD WITH ALL LINKED DASHBOARDS")
         logger.info("="*70)
         
-        # Reset ALL mappings for fresh clone (including table/field mappings)
+        # Fresh load scope + reset ALL mappings for fresh clone (including table/field mappings)
+        self._start_load_scope()
+        self.invalidate_links_cache()
+        self.invalidate_collections_cache()
         self.dashboard_mapping = {}
         self.question_mapping = {}
         self.tab_mapping = {}
         self.dashboard_tab_mappings = {}
         self.table_mapping = {}
         self.field_mapping = {}
+        self._dashboards_with_click_behaviors = set()
+        
+        # Checkpointing (and resuming) is opt-in - only the CLI asks for it
+        checkpoint_path = None
+        if checkpoint_dir:
+            checkpoint_path = os.path.join(
+                checkpoint_dir, CHECKPOINT_TEMPLATE.format(source_id=source_dashboard_id)
+            )
+        self._checkpoint_path = checkpoint_path
+        checkpoint_meta = {
+            'source_dashboard_id': source_dashboard_id,
+            'new_database_id': new_database_id,
+            'new_name': new_name,
+        }
+        if resume and checkpoint_path and self._load_checkpoint(checkpoint_path, checkpoint_meta):
+            logger.info("Resuming from checkpoint %s: %s dashboards, %s questions already cloned",
+                        checkpoint_path, len(self.dashboard_mapping), len(self.question_mapping))
         
         # Build table/field mapping ONCE at the start - this is critical for field filters
         # We need to find the source database from the main dashboard
-        logger.info(f"\nBuilding field mapping for database {new_database_id}...")
-        main_dash = self.manager.get_dashboard(source_dashboard_id)
+        logger.info("\nBuilding field mapping for database %s...", new_database_id)
+        main_dash = self._get_dashboard(source_dashboard_id)
         if main_dash:
             source_db_id = None
             ordered_cards = main_dash.get('dashcards', []) or main_dash.get('ordered_cards', [])
@@ -1465,42 +2381,16 @@ class DashboardCloner:
             
             if source_db_id:
                 self.build_table_field_mapping(source_db_id, new_database_id)
-                logger.info(f"Built field mapping: {len(self.field_mapping)} fields, {len(self.table_mapping)} tables")
+                logger.info("Built field mapping: %s fields, %s tables", len(self.field_mapping), len(self.table_mapping))
             else:
                 logger.warning("Could not determine source database from main dashboard")
         
-        # Find all linked dashboards (in order: deepest first)
-        logger.info(f"\nFinding all linked dashboards from {source_dashboard_id}...")
-        all_linked = self.find_all_linked_dashboards(source_dashboard_id)
-        
-        if all_linked:
-            logger.info(f"Found {len(all_linked)} linked dashboards: {all_linked}")
-            logger.info("Will clone in order: linked dashboards first, then main dashboard")
-        else:
-            logger.info("No linked dashboards found - will clone single dashboard")
-        
-        # Clone order: linked dashboards first, main dashboard last
-        dashboards_to_clone = all_linked + [source_dashboard_id]
-        
-        # Get names of dashboards to clone
-        dashboard_names = {}
-        for dash_id in dashboards_to_clone:
-            dash = self.manager.get_dashboard(dash_id)
-            if dash:
-                dashboard_names[dash_id] = dash.get('name', f'Dashboard {dash_id}')
+        workers = self.dashboard_workers
+        dashboard_names: Dict[int, str] = {}
+        position: Dict[int, int] = {}
+        total = None  # Unknown until discovery finishes when linked dashboards are streamed
         
-        logger.info(f"\nDashboards to clone ({len(dashboards_to_clone)}):")
-        for i, dash_id in enumerate(dashboards_to_clone, 1):
-            logger.info(f"  {i}. {dashboard_names.get(dash_id, dash_id)} (ID: {dash_id})")
-        
-        logger.info("\n" + "="*70)
-        
-        # Clone each dashboard
-        main_dashboard = None
-        for i, dash_id in enumerate(dashboards_to_clone, 1):
-            # Check if stop requested before each dashboard
-            self.check_stop_requested()
-            
+        def clone_one(dash_id):
             original_name = dashboard_names.get(dash_id, f'Dashboard {dash_id}')
             
             # Create new name
@@ -1510,10 +2400,11 @@ class DashboardCloner:
                 # For linked dashboards, prefix with new name
                 clone_name = f"{new_name} - {original_name}"
             
-            logger.info(f"\n[{i}/{len(dashboards_to_clone)}] Cloning: {original_name}")
-            logger.info(f"    New name: {clone_name}")
-            
+            label = f"[{position[dash_id]}/{total}]" if total else f"[{position[dash_id]}]"
+            token = _log_label.set(label)
             try:
+                logger.info("\nCloning: %s\n    New name: %s", original_name, clone_name)
+                
                 # Main dashboard goes to _DASHBOARDS collection if provided
                 # Linked dashboards go to the customer collection
                 if dash_id == source_dashboard_id and main_dashboard_collection_id:
@@ -1528,14 +2419,126 @@ class DashboardCloner:
                     dashboard_collection_id=target_collection,
                     questions_collection_id=questions_collection_id
                 )
-                
                 if new_dashboard:
-                    logger.info(f"    Created: ID {new_dashboard['id']}")
-                    if dash_id == source_dashboard_id:
-                        main_dashboard = new_dashboard
-                        
-            except Exception as e:
-                logger.error(f"    Failed: {e}")
+                    logger.info("    Created: ID %s", new_dashboard['id'])
+                    if checkpoint_path:
+                        self._save_checkpoint(checkpoint_path, checkpoint_meta)
+                return new_dashboard
+            finally:
+                _log_label.reset(token)
+        
+        def collect(executor, futures):
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except StopRequested:
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    raise
+                except Exception as e:
+                    logger.error("    Failed to clone dashboard %s: %s", futures[future], e)
+        
+        if precomputed_linked is not None:
+            # Defensive: no duplicates, and the source is never cloned as one of its own linked
+            # dashboards (e.g. a caller-supplied list that picked it up through a back-link)
+            all_linked = [d for d in dict.fromkeys(precomputed_linked) if d != source_dashboard_id]
+            
+            if all_linked:
+                logger.info("Found %s linked dashboards: %s", len(all_linked), all_linked)
+                logger.info("Will clone in order: linked dashboards first, then main dashboard")
+            else:
+                logger.info("No linked dashboards found - will clone single dashboard")
+            
+            # Clone order: linked dashboards first, main dashboard last
+            dashboards_to_clone = all_linked + [source_dashboard_id]
+            
+            # Get names of dashboards to clone
+            dashboard_names.update(self._bulk_get_dashboard_names(dashboards_to_clone))
+            
+            lines = [f"\nDashboards to clone ({len(dashboards_to_clone)}):"]
+            for i, dash_id in enumerate(dashboards_to_clone, 1):
+                lines.append(f"  {i}. {dashboard_names.get(dash_id, dash_id)} (ID: {dash_id})")
+            logger.info("\n".join(lines))
+            
+            logger.info("\n" + "="*70)
+            
+            # Clone each dashboard. Linked dashboards at the same level don't link to each
+            # other's levels below, so each level is cloned concurrently; the main dashboard
+            # is cloned last, on its own.
+            total = len(dashboards_to_clone)
+            position.update((dash_id, i) for i, dash_id in enumerate(dashboards_to_clone, 1))
+            
+            for level in self._dashboard_levels(all_linked):
+                # Check if stop requested before each level
+                self.check_stop_requested()
+                
+                # Skip dashboards a resumed run already cloned
+                level = [dash_id for dash_id in level if dash_id not in self.dashboard_mapping]
+                if not level:
+                    continue
+                
+                with ThreadPoolExecutor(max_workers=min(workers, len(level))) as executor:
+                    collect(executor, {_submit(executor, clone_one, dash_id): dash_id for dash_id in level})
+        else:
+            # Stream discovery: each linked dashboard is submitted as soon as the traversal
+            # emits it while a producer thread keeps walking the rest of the graph. Post-order
+            # means the dashboards it links to were submitted first; its clone waits for them
+            # (like the level path) so their ids and tab mappings exist when its links are
+            # remapped. The pool is FIFO and a clone only waits on earlier submissions, so the
+            # waits can't deadlock.
+            logger.info("\nCloning dashboards linked from %s as they are found...", source_dashboard_id)
+            logger.info("\n" + "="*70)
+            all_linked = []
+            
+            def clone_after(targets, dash_id):
+                wait(targets)
+                return clone_one(dash_id)
+            
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {}
+                future_by_id = {}
+                for dash_id in self._stream_linked_dashboards(source_dashboard_id, max_depth):
+                    if dash_id in position:
+                        continue
+                    all_linked.append(dash_id)
+                    position[dash_id] = len(all_linked)
+                    
+                    # Skip dashboards a resumed run already cloned
+                    if dash_id in self.dashboard_mapping:
+                        continue
+                    
+                    self.check_stop_requested()
+                    dashboard_names.update(self._bulk_get_dashboard_names([dash_id]))
+                    targets = [future_by_id[t] for t in self.analyze_dashboard_links(dash_id)
+                               if t in future_by_id]
+                    future = _submit(executor, clone_after, targets, dash_id)
+                    futures[future] = dash_id
+                    future_by_id[dash_id] = future
+                collect(executor, futures)
+            
+            if all_linked:
+                logger.info("Found %s linked dashboards: %s", len(all_linked), all_linked)
+            else:
+                logger.info("No linked dashboards found - cloning single dashboard")
+            total = len(all_linked) + 1
+            position[source_dashboard_id] = total
+            dashboard_names.update(self._bulk_get_dashboard_names([source_dashboard_id]))
+        
+        # Check if stop requested before the main dashboard
+        self.check_stop_requested()
+        main_dashboard = None
+        try:
+            if source_dashboard_id in self.dashboard_mapping:
+                main_dashboard = self._get_dashboard(self.dashboard_mapping[source_dashboard_id])
+                logger.info("Main dashboard already cloned: ID %s", self.dashboard_mapping[source_dashboard_id])
+            else:
+                main_dashboard = clone_one(source_dashboard_id)
+        except StopRequested:
+            raise
+        except Exception as e:
+            logger.error("    Failed: %s", e)
+        
+        # The fallback tab mapping is the main dashboard's - linked dashboards only use their own
+        self.tab_mapping = self.dashboard_tab_mappings.get(self.dashboard_mapping.get(source_dashboard_id), {})
         
         # SECOND PASS: Update click behaviors with complete mapping
         # This is needed because when cloning inner dashboards, the main dashboard
@@ -1547,35 +2550,91 @@ class DashboardCloner:
         
         # Log available tab mappings for debugging
         if self.dashboard_tab_mappings:
-            logger.info(f"  Available tab mappings for {len(self.dashboard_tab_mappings)} dashboards:")
+            lines = [f"  Available tab mappings for {len(self.dashboard_tab_mappings)} dashboards:"]
             for dash_id, tab_map in self.dashboard_tab_mappings.items():
-                logger.info(f"    Dashboard {dash_id}: {tab_map}")
-        
-        for old_id, new_id in self.dashboard_mapping.items():
-            try:
-                # Pass tab_mapping as fallback, but _remap_single_click_behavior will
-                # use dashboard_tab_mappings for the target dashboard when available
-                self.update_dashboard_click_behaviors(new_id, self.tab_mapping)
-                logger.info(f"  Updated click behaviors for dashboard {new_id}")
-            except Exception as e:
-                logger.error(f"  Failed to update click behaviors for {new_id}: {e}")
-        
-        # Summary
-        logger.info("\n" + "="*70)
-        logger.info("CLONE COMPLETE!")
-        logger.info("="*70)
-        logger.info(f"Dashboards cloned: {len(self.dashboard_mapping)}")
-        logger.info(f"Questions cloned: {len(self.question_mapping)}")
-        logger.info("\nDashboard ID mapping (old -> new):")
-        for old_id, new_id in self.dashboard_mapping.items():
+                lines.append(f"    Dashboard {dash_id}: {tab_map}")
+            logger.info("\n".join(lines))
+        
+        # Snapshot once - shared by the update loop and the summary below
+        mapping_items = list(self.dashboard_mapping.items())
+        # Dashboards without dashboard/question links have nothing for the complete mapping to fix
+        with_links = self._dashboards_with_click_behaviors
+        to_update = [new_id for _, new_id in mapping_items if new_id in with_links]
+        
+        # Each update is an independent GET + PUT and the mappings are final by now,
+        # so the dashboards are updated concurrently
+        if to_update:
+            # Pass tab_mapping as fallback, but _remap_single_click_behavior will
+            # use dashboard_tab_mappings for the target dashboard when available.
+            # The lookup tables are bundled once and shared by every update.
+            remap = self._click_remap_tables(self.tab_mapping)
+            with ThreadPoolExecutor(max_workers=min(workers, len(to_update))) as executor:
+                futures = {
+                    _submit(executor, self.update_dashboard_click_behaviors,
+                            new_id, self.tab_mapping, None, remap): new_id
+                    for new_id in to_update
+                }
+                for future in as_completed(futures):
+                    new_id = futures[future]
+                    try:
+                        if future.result():
+                            logger.info("  Updated click behaviors for dashboard %s", new_id)
+                        else:
+                            logger.error("  Failed to update click behaviors for %s", new_id)
+                    except Exception as e:
+                        logger.error("  Failed to update click behaviors for %s: %s", new_id, e)
+        
+        # Summary (one record, so it isn't interleaved with other output)
+        lines = [
+            "\n" + "="*70,
+            "CLONE COMPLETE!",
+            "="*70,
+            f"Dashboards cloned: {len(mapping_items)}",
+            f"Questions cloned: {len(self.question_mapping)}",
+            "\nDashboard ID mapping (old -> new):",
+        ]
+        for old_id, new_id in mapping_items:
             name = dashboard_names.get(old_id, f'Dashboard {old_id}')
-            logger.info(f"  {old_id} -> {new_id} ({name})")
-        logger.info("="*70)
+            lines.append(f"  {old_id} -> {new_id} ({name})")
+        lines.append("="*70)
+        logger.info("\n".join(lines))
+        
+        if main_dashboard:
+            self.discard_checkpoint()
         
         return main_dashboard
 
 
-def main():
+RULE = "=" * 70
+
+# Interactive confirmation/result blocks - each is written to stdout in one call
+SUMMARY_TEMPLATE = f"""
+{RULE}
+SUMMARY
+{RULE}
+  Source Dashboard: {{source_id}}
+  Customer: {{customer}}
+  Dashboard Name: {{new_name}}
+  Target Database: {{db_name}} (ID: {{db_id}})
+  Main Dashboard -> _DASHBOARDS collection
+  Linked Dashboards & Questions -> {{collection_name}}
+{{linked_line}}{RULE}
+"""
+
+SUCCESS_TEMPLATE = f"""
+{RULE}
+SUCCESS!
+{RULE}
+  New Dashboard: {{new_name}}
+  Dashboard ID: {{dashboard_id}}
+  Database: {{db_name}}
+  URL: {{base_url}}/dashboard/{{dashboard_id}}
+{{linked_line}}{RULE}
+"""
+
+
+def main(use_cache: bool = False, workers: int = None, clone_linked: bool = True,
+         resume: bool = False):
     """Interactive main function"""
     print("\n" + "="*70)
     print("DASHBOARD CLONE WITH DATABASE CHANGE")
@@ -1592,134 +2651,230 @@ def main():
         print("ERROR: Please edit metabase_config.json with your credentials")
         return
     
-    cloner = DashboardCloner(config)
-    
-    print("Connecting to Metabase...")
-    if not cloner.authenticate():
-        print("ERROR: Authentication failed!")
-        return
-    print("Connected!\n")
-    
-    # Get source dashboard
-    source_id = input("Source Dashboard ID: ").strip()
-    if not source_id.isdigit():
-        print("ERROR: Invalid ID")
-        return
-    source_id = int(source_id)
-    
-    # Analyze linked dashboards - automatically clone all linked dashboards
-    print("\nAnalyzing dashboard for linked dashboards...")
-    all_linked = cloner.find_all_linked_dashboards(source_id)
-    clone_all_linked = True  # Always clone linked dashboards
-    
-    if all_linked:
-        print(f"This dashboard links to {len(all_linked)} other dashboard(s): {all_linked}")
-        print("Will clone all linked dashboards!")
-    else:
-        print("No linked dashboards found.")
-    
-    # Get target database
-    print("\n" + "-"*40)
-    while True:
-        db_name = input("Target Database Name: ").strip()
-        if not db_name:
-            print("Database name is required")
-            continue
+    config['disk_cache'] = use_cache
+    if workers:
+        config['dashboard_workers'] = workers
+        config['clone_workers'] = workers
+    with DashboardCloner(config) as cloner:
+        print("Connecting to Metabase...")
+        if not cloner.authenticate():
+            print("ERROR: Authentication failed!")
+            return
+        print("Connected!\n")
+        
+        # Get source dashboard
+        source_id = input("Source Dashboard ID: ").strip()
+        if not source_id.isdigit():
+            print("ERROR: Invalid ID")
+            return
+        source_id = int(source_id)
+        
+        # Analyze linked dashboards - automatically clone all linked dashboards (unless disabled)
+        clone_all_linked = clone_linked
+        all_linked = []
+        if clone_all_linked:
+            print("\nAnalyzing dashboard for linked dashboards...")
+            all_linked = cloner.find_all_linked_dashboards(source_id)
+            if all_linked:
+                print(f"This dashboard links to {len(all_linked)} other dashboard(s): {all_linked}")
+                print("Will clone all linked dashboards!")
+            else:
+                print("No linked dashboards found.")
+        else:
+            print("\nSkipping linked dashboards - cloning this dashboard only")
+        
+        # Get target database
+        print("\n" + "-"*40)
+        while True:
+            db_name = input("Target Database Name: ").strip()
+            if not db_name:
+                print("Database name is required")
+                continue
+            
+            target_db, suggestions = cloner.find_database(db_name)
+            if target_db:
+                print(f"Found database: {target_db['name']} (ID: {target_db['id']})")
+                break
+            else:
+                print(f"Database '{db_name}' not found!")
+                if suggestions:
+                    print("Did you mean one of these?")
+                    for i, s in enumerate(suggestions, 1):
+                        print(f"  {i}. {s}")
+                    choice = input("Enter number to select, or type a new name: ").strip()
+                    if choice.isdigit() and 1 <= int(choice) <= len(suggestions):
+                        target_db, _ = cloner.find_database(suggestions[int(choice)-1])
+                        if target_db:
+                            print(f"Selected: {target_db['name']} (ID: {target_db['id']})")
+                            break
+        
+        # Get customer name - used for both dashboard name and collection name
+        print("\n" + "-"*40)
+        customer_name = input("Customer Name: ").strip()
+        if not customer_name:
+            print("ERROR: Customer name is required")
+            return
+        
+        # Generate dashboard name and collection name from customer name
+        new_name = f"{customer_name} Dashboard"
+        collection_name = f"{customer_name} Collection"
         
-        target_db, suggestions = cloner.find_database(db_name)
-        if target_db:
-            print(f"Found database: {target_db['name']} (ID: {target_db['id']})")
-            break
+        print(f"Dashboard will be named: {new_name}")
+        print(f"Collection will be named: {collection_name}")
+        
+        # Get source dashboard's parent collection
+        source_parent_collection = cloner.get_dashboard_collection_id(source_id)
+        
+        # Create customer collection in the same parent as source dashboard
+        col = cloner.get_or_create_collection(collection_name, source_parent_collection)
+        if col:
+            collection_id = col['id']
+            print(f"Customer collection: {col['name']} (ID: {col['id']})")
         else:
-            print(f"Database '{db_name}' not found!")
+            collection_id = None
+            print("Warning: Could not create collection, will use root")
+        
+        # Find "_DASHBOARDS" collection in the same parent for main dashboard
+        dashboards_collection_id = None
+        dashboards_col = cloner.find_collection_in_parent('_DASHBOARDS', source_parent_collection)
+        if dashboards_col:
+            dashboards_collection_id = dashboards_col['id']
+            print(f"Main dashboard collection: _DASHBOARDS (ID: {dashboards_collection_id})")
+        
+        if not dashboards_collection_id:
+            print("Warning: _DASHBOARDS collection not found, main dashboard will go to customer collection")
+            dashboards_collection_id = collection_id
+        
+        # Use customer collection for linked dashboards and questions
+        dash_collection_id = collection_id
+        q_collection_id = collection_id
+        
+        # Summary
+        sys.stdout.write(SUMMARY_TEMPLATE.format(
+            source_id=source_id,
+            customer=customer_name,
+            new_name=new_name,
+            db_name=target_db['name'],
+            db_id=target_db['id'],
+            collection_name=collection_name,
+            linked_line=(f"  Linked Dashboards to clone: {len(all_linked)}\n"
+                         if clone_all_linked and all_linked else "")
+        ))
+        
+        confirm = input("\nProceed? (yes/no): ").strip().lower()
+        if confirm not in ['yes', 'y']:
+            print("Cancelled")
+            return
+        
+        print("\n")
+        try:
+            if clone_all_linked and all_linked:
+                # Clone with all linked dashboards
+                # Main dashboard goes to _DASHBOARDS, linked dashboards go to customer collection
+                new_dashboard = cloner.clone_with_all_linked(
+                    source_dashboard_id=source_id,
+                    new_name=new_name,
+                    new_database_id=target_db['id'],
+                    dashboard_collection_id=dash_collection_id,
+                    questions_collection_id=q_collection_id,
+                    main_dashboard_collection_id=dashboards_collection_id,
+                    precomputed_linked=all_linked,
+                    checkpoint_dir=os.getcwd(),
+                    resume=resume
+                )
+            else:
+                # Clone single dashboard - goes to _DASHBOARDS collection
+                new_dashboard = cloner.clone_dashboard(
+                    source_dashboard_id=source_id,
+                    new_name=new_name,
+                    new_database_id=target_db['id'],
+                    dashboard_collection_id=dashboards_collection_id,
+                    questions_collection_id=q_collection_id
+                )
+            
+            sys.stdout.write(SUCCESS_TEMPLATE.format(
+                new_name=new_name,
+                dashboard_id=new_dashboard['id'],
+                db_name=target_db['name'],
+                base_url=config['base_url'],
+                linked_line=(f"  Total dashboards cloned: {len(cloner.dashboard_mapping)}\n"
+                             if clone_all_linked and all_linked else "")
+            ))
+            
+        except Exception as e:
+            print(f"\nERROR: {e}")
+            traceback.print_exc()
+
+
+def run_clone(source_id: int, customer_name: str, database_name: str, 
+              clone_linked: bool = True, use_cache: bool = False, max_depth: int = None,
+              workers: int = None, resume: bool = False):
+    """Non-interactive clone function"""
+    config = load_config()
+    if not config:
+        print("ERROR: Please edit metabase_config.json with your credentials")
+        return None
+    
+    config['disk_cache'] = use_cache
+    if workers:
+        config['dashboard_workers'] = workers
+        config['clone_workers'] = workers
+    with DashboardCloner(config) as cloner:
+        print("Connecting to Metabase...")
+        if not cloner.authenticate():
+            print("ERROR: Authentication failed!")
+            return None
+        print("Connected!\n")
+        
+        # Find database
+        target_db, suggestions = cloner.find_database(database_name)
+        if not target_db:
+            print(f"ERROR: Database '{database_name}' not found!")
             if suggestions:
                 print("Did you mean one of these?")
-                for i, s in enumerate(suggestions, 1):
-                    print(f"  {i}. {s}")
-                choice = input("Enter number to select, or type a new name: ").strip()
-                if choice.isdigit() and 1 <= int(choice) <= len(suggestions):
-                    target_db, _ = cloner.find_database(suggestions[int(choice)-1])
-                    if target_db:
-                        print(f"Selected: {target_db['name']} (ID: {target_db['id']})")
-                        break
-    
-    # Get customer name - used for both dashboard name and collection name
-    print("\n" + "-"*40)
-    customer_name = input("Customer Name: ").strip()
-    if not customer_name:
-        print("ERROR: Customer name is required")
-        return
-    
-    # Generate dashboard name and collection name from customer name
-    new_name = f"{customer_name} Dashboard"
-    collection_name = f"{customer_name} Collection"
-    
-    print(f"Dashboard will be named: {new_name}")
-    print(f"Collection will be named: {collection_name}")
-    
-    # Get source dashboard's parent collection
-    source_parent_collection = cloner.get_dashboard_collection_id(source_id)
-    
-    # Create customer collection in the same parent as source dashboard
-    col = cloner.get_or_create_collection(collection_name, source_parent_collection)
-    if col:
-        collection_id = col['id']
-        print(f"Customer collection: {col['name']} (ID: {col['id']})")
-    else:
-        collection_id = None
-        print("Warning: Could not create collection, will use root")
-    
-    # Find "_DASHBOARDS" collection in the same parent for main dashboard
-    dashboards_collection_id = None
-    collections = cloner.manager.get_collections()
-    for c in collections:
-        if c.get('name') == '_DASHBOARDS' and c.get('location', '').rstrip('/').endswith(f"/{source_parent_collection}") if source_parent_collection else c.get('location') in ['/', None, '']:
-            dashboards_collection_id = c['id']
+                for s in suggestions:
+                    print(f"  - {s}")
+            return None
+        
+        print(f"Target database: {target_db['name']} (ID: {target_db['id']})")
+        
+        # Generate names from customer name
+        new_name = f"{customer_name} Dashboard"
+        collection_name = f"{customer_name} Collection"
+        print(f"Dashboard name: {new_name}")
+        print(f"Collection name: {collection_name}")
+        
+        # Linked dashboards are discovered while cloning (see clone_with_all_linked) -
+        # nothing to confirm non-interactively, so there is no upfront walk
+        if clone_linked:
+            print("Will clone all linked dashboards as they are found!")
+        
+        # Get or create collection in same parent as source dashboard
+        source_parent = cloner.get_dashboard_collection_id(source_id)
+        col = cloner.get_or_create_collection(collection_name, source_parent)
+        collection_id = col['id'] if col else None
+        if col:
+            print(f"Customer collection: {col['name']} (ID: {col['id']})")
+        
+        # Find "_DASHBOARDS" collection in the same parent for main dashboard
+        dashboards_collection_id = None
+        dashboards_col = cloner.find_collection_in_parent('_DASHBOARDS', source_parent)
+        if dashboards_col:
+            dashboards_collection_id = dashboards_col['id']
             print(f"Main dashboard collection: _DASHBOARDS (ID: {dashboards_collection_id})")
-            break
-    
-    # If not found by location, try simpler approach - find by parent_id
-    if not dashboards_collection_id:
-        for c in collections:
-            if c.get('name') == '_DASHBOARDS':
-                # Check if parent matches
-                parent_id = c.get('parent_id')
-                if parent_id == source_parent_collection:
-                    dashboards_collection_id = c['id']
-                    print(f"Main dashboard collection: _DASHBOARDS (ID: {dashboards_collection_id})")
-                    break
-    
-    if not dashboards_collection_id:
-        print("Warning: _DASHBOARDS collection not found, main dashboard will go to customer collection")
-        dashboards_collection_id = collection_id
-    
-    # Use customer collection for linked dashboards and questions
-    dash_collection_id = collection_id
-    q_collection_id = collection_id
-    
-    # Summary
-    print("\n" + "="*70)
-    print("SUMMARY")
-    print("="*70)
-    print(f"  Source Dashboard: {source_id}")
-    print(f"  Customer: {customer_name}")
-    print(f"  Dashboard Name: {new_name}")
-    print(f"  Target Database: {target_db['name']} (ID: {target_db['id']})")
-    print(f"  Main Dashboard -> _DASHBOARDS collection")
-    print(f"  Linked Dashboards & Questions -> {collection_name}")
-    if clone_all_linked and all_linked:
-        print(f"  Linked Dashboards to clone: {len(all_linked)}")
-    print("="*70)
-    
-    confirm = input("\nProceed? (yes/no): ").strip().lower()
-    if confirm not in ['yes', 'y']:
-        print("Cancelled")
-        return
-    
-    print("\n")
-    try:
-        if clone_all_linked and all_linked:
-            # Clone with all linked dashboards
+        
+        if not dashboards_collection_id:
+            print("Warning: _DASHBOARDS collection not found, main dashboard will go to customer collection")
+            dashboards_collection_id = collection_id
+        
+        dash_collection_id = collection_id
+        q_collection_id = collection_id
+        
+        # Clone
+        print("\nStarting clone...")
+        
+        if clone_linked:
+            # Clone with all linked dashboards - discovery is streamed into the clone pool
             # Main dashboard goes to _DASHBOARDS, linked dashboards go to customer collection
             new_dashboard = cloner.clone_with_all_linked(
                 source_dashboard_id=source_id,
@@ -1727,7 +2882,10 @@ def main():
                 new_database_id=target_db['id'],
                 dashboard_collection_id=dash_collection_id,
                 questions_collection_id=q_collection_id,
-                main_dashboard_collection_id=dashboards_collection_id
+                main_dashboard_collection_id=dashboards_collection_id,
+                max_depth=max_depth,
+                checkpoint_dir=os.getcwd(),
+                resume=resume
             )
         else:
             # Clone single dashboard - goes to _DASHBOARDS collection
@@ -1739,124 +2897,17 @@ def main():
                 questions_collection_id=q_collection_id
             )
         
-        print("\n" + "="*70)
-        print("SUCCESS!")
-        print("="*70)
-        print(f"  New Dashboard: {new_name}")
-        print(f"  Dashboard ID: {new_dashboard['id']}")
-        print(f"  Database: {target_db['name']}")
-        print(f"  URL: {config['base_url']}/dashboard/{new_dashboard['id']}")
-        if clone_all_linked and all_linked:
-            print(f"  Total dashboards cloned: {len(cloner.dashboard_mapping)}")
-        print("="*70)
+        if new_dashboard:
+            sys.stdout.write(SUCCESS_TEMPLATE.format(
+                new_name=new_name,
+                dashboard_id=new_dashboard['id'],
+                db_name=target_db['name'],
+                base_url=config['base_url'],
+                linked_line=(f"  Total dashboards cloned: {len(cloner.dashboard_mapping)}\n"
+                             if clone_linked else "")
+            ))
         
-    except Exception as e:
-        print(f"\nERROR: {e}")
-        import traceback
-        traceback.print_exc()
-
-
-def run_clone(source_id: int, customer_name: str, database_name: str, 
-              clone_linked: bool = True):
-    """Non-interactive clone function"""
-    config = load_config()
-    if not config:
-        print("ERROR: Please edit metabase_config.json with your credentials")
-        return None
-    
-    cloner = DashboardCloner(config)
-    
-    print("Connecting to Metabase...")
-    if not cloner.authenticate():
-        print("ERROR: Authentication failed!")
-        return None
-    print("Connected!\n")
-    
-    # Find database
-    target_db, suggestions = cloner.find_database(database_name)
-    if not target_db:
-        print(f"ERROR: Database '{database_name}' not found!")
-        if suggestions:
-            print("Did you mean one of these?")
-            for s in suggestions:
-                print(f"  - {s}")
-        return None
-    
-    print(f"Target database: {target_db['name']} (ID: {target_db['id']})")
-    
-    # Generate names from customer name
-    new_name = f"{customer_name} Dashboard"
-    collection_name = f"{customer_name} Collection"
-    print(f"Dashboard name: {new_name}")
-    print(f"Collection name: {collection_name}")
-    
-    # Analyze linked dashboards
-    all_linked = cloner.find_all_linked_dashboards(source_id)
-    if all_linked:
-        print(f"Dashboard links to {len(all_linked)} dashboards: {all_linked}")
-        if clone_linked:
-            print("Will clone all linked dashboards!")
-    
-    # Get or create collection in same parent as source dashboard
-    source_parent = cloner.get_dashboard_collection_id(source_id)
-    col = cloner.get_or_create_collection(collection_name, source_parent)
-    collection_id = col['id'] if col else None
-    if col:
-        print(f"Customer collection: {col['name']} (ID: {col['id']})")
-    
-    # Find "_DASHBOARDS" collection in the same parent for main dashboard
-    dashboards_collection_id = None
-    collections = cloner.manager.get_collections()
-    for c in collections:
-        if c.get('name') == '_DASHBOARDS' and c.get('parent_id') == source_parent:
-            dashboards_collection_id = c['id']
-            print(f"Main dashboard collection: _DASHBOARDS (ID: {dashboards_collection_id})")
-            break
-    
-    if not dashboards_collection_id:
-        print("Warning: _DASHBOARDS collection not found, main dashboard will go to customer collection")
-        dashboards_collection_id = collection_id
-    
-    dash_collection_id = collection_id
-    q_collection_id = collection_id
-    
-    # Clone
-    print("\nStarting clone...")
-    
-    if clone_linked and all_linked:
-        # Clone with all linked dashboards
-        # Main dashboard goes to _DASHBOARDS, linked dashboards go to customer collection
-        new_dashboard = cloner.clone_with_all_linked(
-            source_dashboard_id=source_id,
-            new_name=new_name,
-            new_database_id=target_db['id'],
-            dashboard_collection_id=dash_collection_id,
-            questions_collection_id=q_collection_id,
-            main_dashboard_collection_id=dashboards_collection_id
-        )
-    else:
-        # Clone single dashboard - goes to _DASHBOARDS collection
-        new_dashboard = cloner.clone_dashboard(
-            source_dashboard_id=source_id,
-            new_name=new_name,
-            new_database_id=target_db['id'],
-            dashboard_collection_id=dashboards_collection_id,
-            questions_collection_id=q_collection_id
-        )
-    
-    if new_dashboard:
-        print("\n" + "="*70)
-        print("SUCCESS!")
-        print("="*70)
-        print(f"  New Dashboard: {new_name}")
-        print(f"  Dashboard ID: {new_dashboard['id']}")
-        print(f"  Database: {target_db['name']}")
-        print(f"  URL: {config['base_url']}/dashboard/{new_dashboard['id']}")
-        if clone_linked and all_linked:
-            print(f"  Total dashboards cloned: {len(cloner.dashboard_mapping)}")
-        print("="*70)
-    
-    return new_dashboard
+        return new_dashboard
 
 
 def diagnose_dashboard(dashboard_id: int):
@@ -1866,15 +2917,14 @@ def diagnose_dashboard(dashboard_id: int):
         print("ERROR: Please edit metabase_config.json with your credentials")
         return
     
-    cloner = DashboardCloner(config)
-    
-    print("Connecting to Metabase...")
-    if not cloner.authenticate():
-        print("ERROR: Authentication failed!")
-        return
-    print("Connected!\n")
-    
-    cloner.diagnose_click_behaviors(dashboard_id)
+    with DashboardCloner(config) as cloner:
+        print("Connecting to Metabase...")
+        if not cloner.authenticate():
+            print("ERROR: Authentication failed!")
+            return
+        print("Connected!\n")
+        
+        cloner.diagnose_click_behaviors(dashboard_id)
 
 
 if __name__ == "__main__":
@@ -1885,8 +2935,18 @@ if __name__ == "__main__":
     parser.add_argument('--customer', '-c', type=str, help='Customer name (used for dashboard and collection names)')
     parser.add_argument('--database', '-d', type=str, help='Target database name')
     parser.add_argument('--diagnose', type=int, help='Diagnose click behaviors in a dashboard (provide dashboard ID)')
+    parser.add_argument('--cache', action='store_true', help='Reuse source database metadata from the on-disk cache')
+    parser.add_argument('--no-cache', action='store_true', help=argparse.SUPPRESS)  # Default now - kept for old scripts
+    parser.add_argument('--max-depth', type=int, default=None, help='Only clone linked dashboards within this many links of the source')
+    parser.add_argument('--workers', type=int, default=None,
+                        help=f'Max concurrent requests per pool: dashboards cloned/updated at once and '
+                             f'card fetches/clones per dashboard (default: {DASHBOARD_WORKERS} and {CLONE_WORKERS})')
+    parser.add_argument('--no-linked', action='store_true', help='Clone only the source dashboard - skip linked dashboard discovery')
+    parser.add_argument('--resume', action='store_true', help='Continue an interrupted linked-dashboard clone from its checkpoint in the current directory')
     
     args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error('--workers must be at least 1')
     
     # If diagnose mode
     if args.diagnose:
@@ -1897,15 +2957,20 @@ if __name__ == "__main__":
             run_clone(
                 source_id=args.source,
                 customer_name=args.customer,
-                database_name=args.database
+                database_name=args.database,
+                clone_linked=not args.no_linked,
+                use_cache=args.cache and not args.no_cache,
+                max_depth=args.max_depth,
+                workers=args.workers,
+                resume=args.resume
             )
         except Exception as e:
             print(f"ERROR: {e}")
-            import traceback
             traceback.print_exc()
     else:
         # Interactive mode
         try:
-            main()
+            main(use_cache=args.cache and not args.no_cache, workers=args.workers, clone_linked=not args.no_linked,
+                 resume=args.resume)
         except KeyboardInterrupt:
             print("\n\nCancelled")